@@ -6,10 +6,11 @@ from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 
+from .bloomin_api import BloominAPI
 from .const import DOMAIN
-from .coordinator import BloominPresenceCoordinator
+from .coordinator import BloominData, BloominPresenceCoordinator
 from .services import async_setup_services, async_unload_services
 
 _LOGGER = logging.getLogger(__name__)
@@ -17,19 +18,43 @@ _LOGGER = logging.getLogger(__name__)
 PLATFORMS: list[Platform] = []
 
 
+@callback
+def _async_update_title_index(hass: HomeAssistant, data: BloominData) -> None:
+    """Rebuild the entry title -> entry_id map used by the services.
+    
+    Only runs when an entry is set up, unloaded or updated, so a service call
+    resolves a title with one dict lookup. The first entry wins on duplicate
+    titles, like the linear search it replaces.
+    """
+    entry_ids_by_title: dict[str, str] = {}
+    for entry_id in data.coordinators:
+        entry = hass.config_entries.async_get_entry(entry_id)
+        if entry:
+            entry_ids_by_title.setdefault(entry.title, entry_id)
+    data.entry_ids_by_title = entry_ids_by_title
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Handle config entry updates (the title may have changed)."""
+    _async_update_title_index(hass, hass.data[DOMAIN])
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up BLOOMIN Presence Display from a config entry."""
     coordinator = BloominPresenceCoordinator(hass, entry)
     
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    data: BloominData = hass.data.setdefault(DOMAIN, BloominData())
+    data.coordinators[entry.entry_id] = coordinator
+    _async_update_title_index(hass, data)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
-    # Set up services
-    if DOMAIN not in hass.data.get("_services_setup", set()):
-        await async_setup_services(hass)
-        hass.data.setdefault("_services_setup", set()).add(DOMAIN)
+    # Set up services (entries may be set up concurrently, so check under the lock)
+    async with data.services_lock:
+        if not data.services_setup:
+            await async_setup_services(hass)
+            data.services_setup = True
     
     return True
 
@@ -38,12 +63,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data: BloominData = hass.data[DOMAIN]
+        coordinator = data.coordinators.pop(entry.entry_id)
+        _async_update_title_index(hass, data)
+        await coordinator.async_shutdown()
         
         # Unload services if no more entries
-        if not hass.data[DOMAIN]:
-            await async_unload_services(hass)
-            hass.data.get("_services_setup", set()).discard(DOMAIN)
+        async with data.services_lock:
+            if not data.coordinators and data.services_setup:
+                await async_unload_services(hass)
+                data.services_setup = False
+        
+        if not data.coordinators:
+            BloominAPI.forget_all()
     
     return unload_ok
-
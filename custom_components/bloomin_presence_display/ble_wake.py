@@ -1,26 +1,60 @@
 """BLE wake functionality for BLOOMIN device."""
 from __future__ import annotations
 
+import asyncio
+from functools import lru_cache
 import logging
+import time
+import uuid
+from collections.abc import Mapping
 from typing import Any
 
+from homeassistant.core import HomeAssistant
+
 try:
     from bleak import BleakClient, BleakScanner
     from bleak.exc import BleakError
-    from bleak_retry_connector import establish_connection, BLEDeviceScanner
     BLEAK_AVAILABLE = True
-    BLEAK_RETRY_AVAILABLE = True
 except ImportError:
     BLEAK_AVAILABLE = False
-    BLEAK_RETRY_AVAILABLE = False
     BleakClient = None  # type: ignore[assignment, misc]
     BleakScanner = None  # type: ignore[assignment, misc]
     BleakError = Exception  # type: ignore[assignment, misc]
+
+try:
+    from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
+    BLEAK_RETRY_AVAILABLE = True
+except ImportError:
+    BLEAK_RETRY_AVAILABLE = False
+    BleakClientWithServiceCache = None  # type: ignore[assignment, misc]
     establish_connection = None  # type: ignore[assignment, misc]
-    BLEDeviceScanner = None  # type: ignore[assignment, misc]
+
+try:
+    from homeassistant.components.bluetooth.wrappers import HaBleakClientWrapper
+    _HAS_HA_WRAPPER = True
+except ImportError:
+    HaBleakClientWrapper = None  # type: ignore[assignment, misc]
+    _HAS_HA_WRAPPER = False
+
+try:
+    from homeassistant.components.bluetooth import async_ble_device_from_address
+except ImportError:
+    async_ble_device_from_address = None  # type: ignore[assignment]
 
 _LOGGER = logging.getLogger(__name__)
 
+__all__ = [
+    "BLEAK_AVAILABLE",
+    "BloominBleSession",
+    "DEFAULT_BLE_CHARACTERISTIC_UUID",
+    "DEFAULT_BLE_SERVICE_UUID",
+    "WAKE_COMMAND",
+    "clear_gatt_cache",
+    "discover_ble_services",
+    "wake_device_via_ble",
+    "wake_devices_via_ble",
+]
+
 # Default BLOOMIN BLE Service UUID (fallback if not discovered)
 # Note: These UUIDs are placeholders and should be discovered during setup
 # Based on https://github.com/mistrsoft/bloomin8_bt_wake:
@@ -37,8 +71,304 @@ DEFAULT_BLE_CHARACTERISTIC_UUID = "0000f001-0000-1000-8000-00805f9b34fb"
 # - Wake command: 0x01 (single byte) to characteristic 0000f001-0000-1000-8000-00805f9b34fb
 WAKE_COMMAND = bytes([0x01])
 
+# Wake characteristic as an integer so discovery compares numbers, not strings
+_WAKE_CHAR_INT = uuid.UUID(DEFAULT_BLE_CHARACTERISTIC_UUID).int
+
+# Discovered GATT layout per device, keyed by normalized MAC address.
+# Values are (service_uuid, characteristic_uuid, discovered_at).
+# BLOOMIN8's wake characteristic is fixed, so re-running service discovery on
+# every wake only adds connection latency.
+GATT_CACHE_TTL = 24 * 60 * 60  # seconds
+_GATT_CACHE: dict[str, tuple[str, str, float]] = {}
+
+# Seconds a persistent BLE session stays connected without being used
+BLE_SESSION_IDLE_TIMEOUT = 30.0
+
+# Maximum simultaneous BLE operations across the whole adapter. Extra callers
+# queue instead of contending for the adapter and timing out.
+BLE_MAX_CONCURRENT_CONNECTIONS = 3
+_ADAPTER_SEMAPHORE: asyncio.Semaphore | None = None
+
+
+def _adapter_semaphore() -> asyncio.Semaphore:
+    """Return the adapter-wide semaphore, creating it inside the running loop."""
+    global _ADAPTER_SEMAPHORE
+    if _ADAPTER_SEMAPHORE is None:
+        _ADAPTER_SEMAPHORE = asyncio.Semaphore(BLE_MAX_CONCURRENT_CONNECTIONS)
+    return _ADAPTER_SEMAPHORE
+
+
+@lru_cache(maxsize=64)
+def _normalize_mac(mac_address: str) -> str:
+    """Normalize a MAC address to upper-case, colon-separated form."""
+    return mac_address.upper().replace("-", ":").replace("_", ":")
+
+
+def _get_cached_gatt(mac_address: str) -> tuple[str, str] | None:
+    """Return cached (service_uuid, characteristic_uuid) if still fresh."""
+    cached = _GATT_CACHE.get(mac_address)
+    if cached is None:
+        return None
+    service_uuid, char_uuid, discovered_at = cached
+    if time.monotonic() - discovered_at > GATT_CACHE_TTL:
+        _GATT_CACHE.pop(mac_address, None)
+        return None
+    return service_uuid, char_uuid
+
+
+def _store_gatt(mac_address: str, service_uuid: str, char_uuid: str) -> None:
+    """Remember the GATT layout discovered for a device.
+    
+    Only called with a characteristic resolved by _find_wake_char, so a cache
+    hit never stands in for the placeholder default UUIDs.
+    """
+    _GATT_CACHE[mac_address] = (service_uuid, char_uuid, time.monotonic())
+
+
+def clear_gatt_cache(mac_address: str | None = None) -> None:
+    """Forget cached GATT layout (e.g. after a firmware update).
+
+    Args:
+        mac_address: Device to forget, or None to clear every cached device
+    """
+    if mac_address is None:
+        _GATT_CACHE.clear()
+        return
+    _GATT_CACHE.pop(_normalize_mac(mac_address), None)
+
+
+async def _async_connect(hass: HomeAssistant, mac_address: str, timeout: float) -> Any | None:
+    """Connect to a BLOOMIN device and return the connected client, or None.
+    
+    The BLEDevice is taken from Home Assistant's bluetooth integration, which
+    already scans passively, so no extra scan is needed before connecting.
+    """
+    device = None
+    if async_ble_device_from_address is not None:
+        device = async_ble_device_from_address(hass, mac_address, connectable=True)
+        if device is None:
+            _LOGGER.debug("BLE device not known to Home Assistant bluetooth: %s", mac_address)
+    
+    # Use bleak-retry-connector for more reliable connections (matching Home Assistant best practices)
+    if BLEAK_RETRY_AVAILABLE and establish_connection and device is not None:
+        resolved_device = device
+        
+        def _ble_device_callback() -> Any:
+            # Pick up the freshest advertisement data on each retry
+            return (
+                async_ble_device_from_address(hass, mac_address, connectable=True)
+                or resolved_device
+            )
+        
+        # BleakClientWithServiceCache keeps the GATT database across reconnects,
+        # so reconnecting does not trigger a full service rediscovery
+        client = await establish_connection(
+            BleakClientWithServiceCache,
+            device,
+            name="BLOOMIN",
+            ble_device_callback=_ble_device_callback,
+            timeout=timeout,
+            use_services_cache=True,
+        )
+        # establish_connection already connects, so check connection status
+        if not client.is_connected:
+            _LOGGER.error("Failed to connect to BLE device: %s", mac_address)
+            return None
+        _LOGGER.debug("Connected to BLE device: %s", mac_address)
+        return client
+    
+    # Fallback: try to scan first, then connect
+    if device is None and BLEAK_AVAILABLE and BleakScanner:
+        _LOGGER.debug("Scanning for BLE device: %s", mac_address)
+        try:
+            device = await BleakScanner.find_device_by_address(
+                mac_address,
+                timeout=timeout,
+            )
+            if not device:
+                _LOGGER.error("BLE device not found during scan: %s", mac_address)
+                return None
+            _LOGGER.debug("Found BLE device: %s", mac_address)
+        except Exception as e:
+            _LOGGER.warning("BLE scan failed: %s. Attempting direct connection.", e)
+    
+    client = BleakClient(device or mac_address, timeout=timeout)
+    try:
+        await client.connect()
+        if not client.is_connected:
+            _LOGGER.error("Failed to connect to BLE device: %s", mac_address)
+            return None
+    except Exception as e:
+        _LOGGER.error("Failed to connect to BLE device: %s", e)
+        return None
+    _LOGGER.debug("Connected to BLE device: %s", mac_address)
+    return client
+
+
+async def _write_wake_command(client: Any, char_uuid: str) -> None:
+    """Write the wake command to the given characteristic."""
+    # Direct write to characteristic UUID (matching bloomin8_bt_wake implementation)
+    # This is the simplest and most reliable method
+    # The wake byte is idempotent, so prefer write-without-response (saves one
+    # ATT round trip) when the characteristic supports it
+    response = True
+    try:
+        characteristic = client.services.get_characteristic(char_uuid)
+        if characteristic is not None and "write-without-response" in characteristic.properties:
+            response = False
+    except Exception as e:
+        _LOGGER.debug("Could not read characteristic properties for %s: %s", char_uuid, e)
+    
+    _LOGGER.debug(
+        "Writing wake command to characteristic: %s (response=%s)", char_uuid, response
+    )
+    await client.write_gatt_char(
+        char_uuid,
+        WAKE_COMMAND,
+        response=response,
+    )
+
+
+class BloominBleSession:
+    """Persistent BLE connection to a BLOOMIN device.
+    
+    Keeps one client connected between wake calls so bursts of service calls
+    don't pay the connect round trip each time. The connection is dropped
+    after it has been idle for `idle_timeout` seconds or when an operation
+    inside the session fails.
+    
+    Usage:
+        async with session:
+            await session.client.write_gatt_char(...)
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        mac_address: str,
+        timeout: float = 10.0,
+        idle_timeout: float = BLE_SESSION_IDLE_TIMEOUT,
+    ) -> None:
+        """Initialize the session (does not connect yet)."""
+        self.hass = hass
+        self.mac_address = _normalize_mac(mac_address)
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.client: Any | None = None
+        self.last_used = 0.0
+        self._lock = asyncio.Lock()
+        self._idle_task: asyncio.Task | None = None
+
+    @property
+    def is_connected(self) -> bool:
+        """Return True if the underlying client is connected."""
+        return self.client is not None and self.client.is_connected
+
+    async def __aenter__(self) -> BloominBleSession:
+        """Acquire the session, connecting if needed."""
+        await self._lock.acquire()
+        try:
+            if not self.is_connected:
+                self.client = await _async_connect(self.hass, self.mac_address, self.timeout)
+                if self.client is None:
+                    raise BleakError(f"Failed to connect to BLE device: {self.mac_address}")
+        except BaseException:
+            self._lock.release()
+            raise
+        self.last_used = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Release the session and schedule the idle disconnect."""
+        try:
+            self.last_used = time.monotonic()
+            if exc_type is not None:
+                # Connection state is unknown after a failure; start fresh next time
+                await self._disconnect()
+            elif self._idle_task is None or self._idle_task.done():
+                self._idle_task = asyncio.get_running_loop().create_task(
+                    self._idle_disconnect()
+                )
+        finally:
+            self._lock.release()
+
+    async def _idle_disconnect(self) -> None:
+        """Disconnect once the session has not been used for idle_timeout."""
+        while True:
+            remaining = self.idle_timeout - (time.monotonic() - self.last_used)
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+                continue
+            async with self._lock:
+                if time.monotonic() - self.last_used >= self.idle_timeout:
+                    _LOGGER.debug("Closing idle BLE session: %s", self.mac_address)
+                    await self._disconnect()
+                    return
+
+    async def _disconnect(self) -> None:
+        """Disconnect the client (caller must hold the lock)."""
+        client, self.client = self.client, None
+        if client is not None and client.is_connected:
+            try:
+                await client.disconnect()
+            except Exception as e:
+                _LOGGER.debug("Error disconnecting BLE session %s: %s", self.mac_address, e)
+
+    async def close(self) -> None:
+        """Close the session and cancel the idle timer."""
+        if self._idle_task is not None and not self._idle_task.done():
+            self._idle_task.cancel()
+        self._idle_task = None
+        async with self._lock:
+            await self._disconnect()
+
+
+def _find_wake_char(services: Any) -> tuple[str, str] | None:
+    """Find the characteristic to write the wake command to.
+    
+    Returns as soon as the known BLOOMIN8 wake characteristic is found
+    (https://github.com/mistrsoft/bloomin8_bt_wake: 0000f001-0000-1000-8000-00805f9b34fb).
+    Only if it is missing, a second pass picks the first writable characteristic.
+    
+    Returns:
+        Tuple of (service_uuid, characteristic_uuid), or None if nothing is writable
+    """
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Services: %s", [service.uuid for service in services])
+        for service in services:
+            _LOGGER.debug(
+                "Characteristics for %s: %s",
+                service.uuid,
+                [(char.uuid, char.properties) for char in service.characteristics]
+            )
+    
+    for service in services:
+        for char in service.characteristics:
+            if "write" in char.properties and uuid.UUID(char.uuid).int == _WAKE_CHAR_INT:
+                _LOGGER.info(
+                    "Found BLOOMIN8 wake characteristic: service=%s, char=%s",
+                    service.uuid,
+                    char.uuid
+                )
+                return service.uuid, char.uuid
+    
+    # Fallback to first writable characteristic
+    for service in services:
+        for char in service.characteristics:
+            if "write" in char.properties:
+                _LOGGER.debug(
+                    "Found writable characteristic: service=%s, char=%s",
+                    service.uuid,
+                    char.uuid
+                )
+                return service.uuid, char.uuid
+    
+    return None
+
 
-async def discover_ble_services(mac_address: str, timeout: float = 10.0) -> dict[str, str] | None:
+async def discover_ble_services(
+    hass: HomeAssistant, mac_address: str, timeout: float = 10.0
+) -> dict[str, str] | None:
     """Discover BLE services and characteristics for BLOOMIN device.
     
     Note: This function is optional. If discovery fails, default UUIDs will be used.
@@ -46,6 +376,7 @@ async def discover_ble_services(mac_address: str, timeout: float = 10.0) -> dict
     as wake_device_via_ble can work with default UUIDs.
     
     Args:
+        hass: Home Assistant instance (used to resolve the BLEDevice)
         mac_address: BLE MAC address of the device
         timeout: Connection timeout in seconds
         
@@ -61,177 +392,62 @@ async def discover_ble_services(mac_address: str, timeout: float = 10.0) -> dict
         return None
     
     # Normalize MAC address format
-    mac_address = mac_address.upper().replace("-", ":").replace("_", ":")
+    mac_address = _normalize_mac(mac_address)
+    
+    cached = _get_cached_gatt(mac_address)
+    if cached:
+        _LOGGER.debug("Using cached GATT layout for device: %s", mac_address)
+        return {"service_uuid": cached[0], "characteristic_uuid": cached[1]}
     
     _LOGGER.debug("Attempting BLE service discovery for device: %s", mac_address)
     
     try:
-        # Use bleak-retry-connector for more reliable connections
-        if BLEAK_RETRY_AVAILABLE and establish_connection:
-            # Use BLEDeviceScanner to ensure device is discovered before connecting
-            scanner = None
-            if BLEDeviceScanner:
-                scanner = BLEDeviceScanner()
-            
-            client = await establish_connection(
-                BleakClient,
-                mac_address,
-                name="BLOOMIN",
-                scanner=scanner,
-                timeout=timeout,
-            )
-            # establish_connection already connects, so check connection status
-            if not client.is_connected:
-                _LOGGER.error("Failed to connect to BLE device for discovery: %s", mac_address)
+        async with _adapter_semaphore():
+            client = await _async_connect(hass, mac_address, timeout)
+            if client is None:
                 return None
-        else:
-            # Fallback: try to scan first, then connect
-            if BLEAK_AVAILABLE and BleakScanner:
-                _LOGGER.debug("Scanning for BLE device: %s", mac_address)
-                try:
-                    device = await BleakScanner.find_device_by_address(
-                        mac_address,
-                        timeout=timeout,
-                    )
-                    if not device:
-                        _LOGGER.error("BLE device not found during scan: %s", mac_address)
-                        return None
-                    _LOGGER.debug("Found BLE device: %s", mac_address)
-                except Exception as e:
-                    _LOGGER.warning("BLE scan failed: %s. Attempting direct connection.", e)
             
-            client = BleakClient(mac_address, timeout=timeout)
             try:
-                await client.connect()
-                if not client.is_connected:
-                    _LOGGER.error("Failed to connect to BLE device for discovery: %s", mac_address)
+                _LOGGER.debug("Connected to BLE device for discovery: %s", mac_address)
+                
+                if _HAS_HA_WRAPPER and isinstance(client, HaBleakClientWrapper):
+                    # HaBleakClientWrapper doesn't support get_services()
+                    # This is OK - we'll use default UUIDs which are known to work
+                    _LOGGER.debug(
+                        "Skipping service discovery for HaBleakClientWrapper. "
+                        "Will use default UUIDs which are known to work for BLOOMIN8."
+                    )
                     return None
-            except Exception as e:
-                _LOGGER.error("Failed to connect to BLE device: %s", e)
-                return None
-        
-        try:
-            _LOGGER.debug("Connected to BLE device for discovery: %s", mac_address)
-            
-            # Check if this is a wrapper class that doesn't support service discovery
-            client_type_name = type(client).__name__
-            if 'Wrapper' in client_type_name or 'HaBleak' in client_type_name:
-                # Wrapper classes (like HaBleakClientWrapper) don't support get_services()
-                # This is OK - we'll use default UUIDs which are known to work
-                _LOGGER.debug(
-                    "Skipping service discovery for wrapper class: %s. "
-                    "Will use default UUIDs which are known to work for BLOOMIN8.",
-                    client_type_name
-                )
-                return None
-            
-            # Get all services - handle both BleakClient and wrapper classes
-            services = None
-            try:
-                # Method 1: Try get_services() method (standard BleakClient)
-                if hasattr(client, 'get_services'):
-                    try:
-                        get_services_method = getattr(client, 'get_services')
-                        if callable(get_services_method):
-                            services = await get_services_method()
-                    except AttributeError:
-                        pass
-                    except Exception as e:
-                        _LOGGER.debug("Failed to call get_services: %s", e)
                 
-                # Method 2: Try services property
-                if services is None and hasattr(client, 'services'):
-                    try:
-                        services = client.services
-                        if hasattr(services, '__await__'):
-                            services = await services
-                    except AttributeError:
-                        pass
-                    except Exception as e:
-                        _LOGGER.debug("Failed to access services property: %s", e)
+                try:
+                    services = await client.get_services()
+                except Exception as e:
+                    # Discovery is optional, so just return None and use default UUIDs
+                    _LOGGER.debug("Error during service discovery (this is OK): %s", e)
+                    return None
                 
-                # Method 3: Try to access internal client if it's a wrapper
-                if services is None:
-                    internal_client = None
-                    for attr_name in ['_client', 'client', '_ble_client']:
-                        if hasattr(client, attr_name):
-                            try:
-                                internal_client = getattr(client, attr_name)
-                                if internal_client and hasattr(internal_client, 'get_services'):
-                                    services = await internal_client.get_services()
-                                    break
-                            except (AttributeError, Exception) as e:
-                                _LOGGER.debug("Failed to access internal client via %s: %s", attr_name, e)
-                                continue
+                # Look for writable characteristics (likely to be wake/control)
+                found = _find_wake_char(services)
                 
-            except Exception as e:
-                # Any unexpected error - discovery is optional, so just return None
-                _LOGGER.debug("Error during service discovery (this is OK): %s", e)
-                return None
-            
-            if services is None:
-                # This is OK - discovery is optional. Default UUIDs will be used.
-                _LOGGER.debug(
-                    "Could not access services from client (type: %s). "
-                    "This is expected with some wrapper classes. Will use default UUIDs.",
-                    client_type_name
-                )
-                return None
-            
-            # Look for writable characteristics (likely to be wake/control)
-            discovered_service = None
-            discovered_characteristic = None
-            
-            for service in services:
-                _LOGGER.debug("Found service: %s", service.uuid)
-                for char in service.characteristics:
-                    _LOGGER.debug(
-                        "Found characteristic: %s (properties: %s)",
-                        char.uuid,
-                        char.properties
+                if found:
+                    result = {
+                        "service_uuid": str(found[0]),
+                        "characteristic_uuid": str(found[1]),
+                    }
+                    _store_gatt(mac_address, result["service_uuid"], result["characteristic_uuid"])
+                    _LOGGER.info(
+                        "BLE discovery successful: service=%s, characteristic=%s",
+                        result["service_uuid"],
+                        result["characteristic_uuid"]
                     )
-                    # Look for writable characteristics (wake commands are typically writable)
-                    # Prefer the known BLOOMIN8 wake characteristic UUID if found
-                    # Based on https://github.com/mistrsoft/bloomin8_bt_wake: 0000f001-0000-1000-8000-00805f9b34fb
-                    if "write" in char.properties:
-                        # Prefer known BLOOMIN8 wake characteristic
-                        if char.uuid.lower() == "0000f001-0000-1000-8000-00805f9b34fb":
-                            discovered_service = service.uuid
-                            discovered_characteristic = char.uuid
-                            _LOGGER.info(
-                                "Found BLOOMIN8 wake characteristic: service=%s, char=%s",
-                                service.uuid,
-                                char.uuid
-                            )
-                            break  # Found the specific one, no need to continue
-                        elif not discovered_characteristic:
-                            # Fallback to first writable characteristic
-                            discovered_service = service.uuid
-                            discovered_characteristic = char.uuid
-                            _LOGGER.debug(
-                                "Found writable characteristic: service=%s, char=%s",
-                                service.uuid,
-                                char.uuid
-                            )
-            
-            if discovered_service and discovered_characteristic:
-                result = {
-                    "service_uuid": str(discovered_service),
-                    "characteristic_uuid": str(discovered_characteristic),
-                }
-                _LOGGER.info(
-                    "BLE discovery successful: service=%s, characteristic=%s",
-                    result["service_uuid"],
-                    result["characteristic_uuid"]
-                )
-                return result
-            else:
-                _LOGGER.warning("No writable characteristic found during BLE discovery")
-                return None
-        finally:
-            if client.is_connected:
-                await client.disconnect()
-                
+                    return result
+                else:
+                    _LOGGER.warning("No writable characteristic found during BLE discovery")
+                    return None
+            finally:
+                if client.is_connected:
+                    await client.disconnect()
+                    
     except BleakError as e:
         _LOGGER.error("BLE error during discovery: %s", e)
         return None
@@ -244,20 +460,24 @@ async def discover_ble_services(mac_address: str, timeout: float = 10.0) -> dict
 
 
 async def wake_device_via_ble(
+    hass: HomeAssistant,
     mac_address: str,
     service_uuid: str | None = None,
     characteristic_uuid: str | None = None,
-    timeout: float = 10.0
+    timeout: float = 10.0,
+    session: BloominBleSession | None = None,
 ) -> bool:
     """Wake up BLOOMIN device via BLE.
     
     Implementation matches https://github.com/mistrsoft/bloomin8_bt_wake
     
     Args:
+        hass: Home Assistant instance (used to resolve the BLEDevice)
         mac_address: BLE MAC address of the device (format: "AA:BB:CC:DD:EE:FF")
         service_uuid: BLE service UUID (if None, will use default)
         characteristic_uuid: BLE characteristic UUID (if None, will use default: 0000f001-0000-1000-8000-00805f9b34fb)
         timeout: Connection timeout in seconds
+        session: Persistent BLE session to reuse (if None, connects once and disconnects)
         
     Returns:
         True if wake command was sent successfully, False otherwise
@@ -271,86 +491,39 @@ async def wake_device_via_ble(
         return False
     
     # Normalize MAC address format
-    mac_address = mac_address.upper().replace("-", ":").replace("_", ":")
+    mac_address = _normalize_mac(mac_address)
     
     _LOGGER.info("Attempting to wake BLOOMIN device via BLE: %s", mac_address)
     
-    # Use provided UUIDs or defaults (matching bloomin8_bt_wake)
-    target_char_uuid = characteristic_uuid or DEFAULT_BLE_CHARACTERISTIC_UUID
+    # Use provided UUIDs, then cached GATT layout, then defaults (matching bloomin8_bt_wake)
+    cached = _get_cached_gatt(mac_address)
+    target_service_uuid = service_uuid or (cached[0] if cached else DEFAULT_BLE_SERVICE_UUID)
+    target_char_uuid = characteristic_uuid or (cached[1] if cached else DEFAULT_BLE_CHARACTERISTIC_UUID)
     
     _LOGGER.debug(
-        "Using BLE Characteristic UUID: %s (from bloomin8_bt_wake)",
-        target_char_uuid
+        "Using BLE Characteristic UUID: %s (%s)",
+        target_char_uuid,
+        "cached" if cached and not characteristic_uuid else "from bloomin8_bt_wake"
     )
     
     try:
-        # Use bleak-retry-connector for more reliable connections (matching Home Assistant best practices)
-        if BLEAK_RETRY_AVAILABLE and establish_connection:
-            # Use BLEDeviceScanner to ensure device is discovered before connecting
-            scanner = None
-            if BLEDeviceScanner:
-                scanner = BLEDeviceScanner()
-            
-            client = await establish_connection(
-                BleakClient,
-                mac_address,
-                name="BLOOMIN",
-                scanner=scanner,
-                timeout=timeout,
-            )
-            # establish_connection already connects, so check connection status
-            if not client.is_connected:
-                _LOGGER.error("Failed to connect to BLE device: %s", mac_address)
-                return False
-        else:
-            # Fallback: try to scan first, then connect
-            if BLEAK_AVAILABLE and BleakScanner:
-                _LOGGER.debug("Scanning for BLE device: %s", mac_address)
-                try:
-                    device = await BleakScanner.find_device_by_address(
-                        mac_address,
-                        timeout=timeout,
-                    )
-                    if not device:
-                        _LOGGER.error("BLE device not found during scan: %s", mac_address)
-                        return False
-                    _LOGGER.debug("Found BLE device: %s", mac_address)
-                except Exception as e:
-                    _LOGGER.warning("BLE scan failed: %s. Attempting direct connection.", e)
-            
-            client = BleakClient(mac_address, timeout=timeout)
-            try:
-                await client.connect()
-                if not client.is_connected:
-                    _LOGGER.error("Failed to connect to BLE device: %s", mac_address)
+        async with _adapter_semaphore():
+            if session is not None:
+                # Reuse the persistent connection; it is dropped on error and after idling
+                async with session:
+                    await _write_wake_command(session.client, target_char_uuid)
+            else:
+                client = await _async_connect(hass, mac_address, timeout)
+                if client is None:
                     return False
-            except Exception as e:
-                _LOGGER.error("Failed to connect to BLE device: %s", e)
-                return False
+                try:
+                    await _write_wake_command(client, target_char_uuid)
+                finally:
+                    if client.is_connected:
+                        await client.disconnect()
         
-        try:
-            _LOGGER.debug("Connected to BLE device: %s", mac_address)
-            
-            # Direct write to characteristic UUID (matching bloomin8_bt_wake implementation)
-            # This is the simplest and most reliable method
-            _LOGGER.debug("Writing wake command to characteristic: %s", target_char_uuid)
-            await client.write_gatt_char(
-                target_char_uuid,
-                WAKE_COMMAND,
-                response=True,
-            )
-            _LOGGER.info("Wake command sent successfully via BLE (matching bloomin8_bt_wake)")
-            return True
-            
-        except BleakError as e:
-            _LOGGER.error("BLE error writing to characteristic %s: %s", target_char_uuid, e)
-            return False
-        except Exception as e:
-            _LOGGER.error("Unexpected error writing to characteristic: %s", e)
-            return False
-        finally:
-            if client.is_connected:
-                await client.disconnect()
+        _LOGGER.info("Wake command sent successfully via BLE (matching bloomin8_bt_wake)")
+        return True
             
     except BleakError as e:
         _LOGGER.error("BLE error while waking device: %s", e)
@@ -358,10 +531,54 @@ async def wake_device_via_ble(
     except TimeoutError:
         _LOGGER.error("BLE connection timeout while waking device: %s", mac_address)
         return False
-    except (OSError, PermissionError) as e:
+    except OSError as e:
         _LOGGER.error("System error while waking device via BLE (check Bluetooth permissions): %s", e)
         return False
     except Exception as e:
         _LOGGER.error("Unexpected error while waking device via BLE: %s", e, exc_info=True)
         return False
 
+
+async def wake_devices_via_ble(
+    hass: HomeAssistant,
+    targets: list[tuple[str, str | None, str | None]],
+    timeout: float = 10.0,
+    max_concurrent: int = 4,
+    sessions: Mapping[str, BloominBleSession] | None = None,
+) -> list[bool]:
+    """Wake several BLOOMIN devices via BLE concurrently.
+    
+    Connection attempts are capped at max_concurrent, since adapters only
+    handle a few simultaneous connections.
+    
+    Args:
+        hass: Home Assistant instance
+        targets: List of (mac_address, service_uuid, characteristic_uuid)
+        timeout: Connection timeout in seconds for each device
+        max_concurrent: Maximum number of simultaneous BLE connections
+        sessions: Persistent sessions keyed by MAC address, reused when present
+        
+    Returns:
+        Wake result for each target, in the same order as targets
+    """
+    semaphore = asyncio.Semaphore(max_concurrent)
+    sessions = sessions or {}
+    
+    async def _wake_one(
+        mac_address: str, service_uuid: str | None, characteristic_uuid: str | None
+    ) -> bool:
+        async with semaphore:
+            return await wake_device_via_ble(
+                hass,
+                mac_address,
+                service_uuid,
+                characteristic_uuid,
+                timeout=timeout,
+                session=sessions.get(_normalize_mac(mac_address)),
+            )
+    
+    results = await asyncio.gather(
+        *(_wake_one(*target) for target in targets),
+        return_exceptions=True,
+    )
+    return [result is True for result in results]
@@ -2,17 +2,119 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
+import functools
 import logging
+from typing import Any, Final, TypeVar
 
 import aiohttp
+from yarl import URL
 
 _LOGGER = logging.getLogger(__name__)
 
+# Wake endpoint paths seen across BLOOMIN firmware versions
+WAKE_ENDPOINT_CANDIDATES: Final[tuple[str, ...]] = ("/api/wake", "/wake", "/api/ping", "/ping")
+
+# Probe responses that show the endpoint exists (the device may still reject the probe method)
+_PROBE_OK_STATUSES: Final[tuple[int, ...]] = (200, 204, 400, 405)
+# Path no firmware serves. Some servers reject OPTIONS/HEAD with the same status on
+# every path, so a candidate only counts if it answers differently from this one
+_PROBE_MISSING_PATH: Final = "/bloomin-presence-probe-missing"
+
+# LAN devices answer within milliseconds once connected, so a slow connect
+# means the device is asleep or the IP is wrong: fail those fast
+_PROBE_TIMEOUT = aiohttp.ClientTimeout(total=3, connect=1.0, sock_connect=1.0, sock_read=2.0)
+_NORMAL_TIMEOUT = aiohttp.ClientTimeout(total=10, connect=2.0)
+
+# Caps on simultaneous wake requests across all devices, and on requests in
+# flight per device, so bursts of wakes do not overwhelm low-power firmware.
+# The per-device cap is enforced by each client's semaphore, since requests go
+# through Home Assistant's shared session and its connection pool
+HTTP_MAX_CONCURRENT_WAKES = 4
+HTTP_MAX_CONNECTIONS_PER_HOST = 2
+_WAKE_SEMAPHORE: asyncio.Semaphore | None = None
+
+
+def _wake_semaphore() -> asyncio.Semaphore:
+    """Return the process-wide wake semaphore, creating it inside the running loop."""
+    global _WAKE_SEMAPHORE
+    if _WAKE_SEMAPHORE is None:
+        _WAKE_SEMAPHORE = asyncio.Semaphore(HTTP_MAX_CONCURRENT_WAKES)
+    return _WAKE_SEMAPHORE
+
+
+# Discoveries in flight, keyed by device IP, so concurrent callers share one run
+_DISCOVERY_TASKS: dict[str, asyncio.Task[dict[str, str]]] = {}
+
+_T = TypeVar("_T")
+
+
+def _http_guard(
+    name: str, default: Any, level: int = logging.ERROR
+) -> Callable[[Callable[..., Awaitable[_T]]], Callable[..., Awaitable[_T]]]:
+    """Log and swallow request errors, returning default instead.
+    
+    Args:
+        name: Operation name used in the log message
+        default: Value returned when the request fails
+        level: Log level for failures (probes fail routinely, so they log at debug)
+    """
+    def decorator(func: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> _T:
+            try:
+                return await func(*args, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                _LOGGER.log(level, "Network error during %s: %s", name, e)
+            except Exception as e:
+                _LOGGER.log(level, "Unexpected error during %s: %s", name, e)
+            return default
+        return wrapper
+    return decorator
+
 
 class BloominAPI:
     """Client for BLOOMIN device API."""
 
-    def __init__(self, ip_address: str, wake_endpoint: str | None = None) -> None:
+    # One client per device IP so setup and runtime share the warm session
+    _INSTANCES: dict[str, BloominAPI] = {}
+
+    @classmethod
+    def get(
+        cls,
+        ip_address: str,
+        session: aiohttp.ClientSession,
+        wake_endpoint: str | None = None,
+    ) -> BloominAPI:
+        """Return the client for a device, creating it if needed.
+        
+        Args:
+            ip_address: IP address of the BLOOMIN device
+            session: Session to send requests with (Home Assistant's shared one)
+            wake_endpoint: Wake endpoint path; updates the cached client when given
+        """
+        api = cls._INSTANCES.get(ip_address)
+        if api is None:
+            api = cls._INSTANCES[ip_address] = cls(
+                ip_address, session, wake_endpoint=wake_endpoint
+            )
+        else:
+            api._session = session
+            if wake_endpoint:
+                api.wake_endpoint = wake_endpoint
+        return api
+
+    @classmethod
+    def forget_all(cls) -> None:
+        """Forget every cached client (the session belongs to the caller and stays open)."""
+        cls._INSTANCES.clear()
+
+    def __init__(
+        self,
+        ip_address: str,
+        session: aiohttp.ClientSession,
+        wake_endpoint: str | None = None,
+    ) -> None:
         """Initialize the BLOOMIN API client.
         
         Note: Image upload is handled by the official bloomin8_eink_canvas integration
@@ -20,12 +122,29 @@ class BloominAPI:
         
         Args:
             ip_address: IP address of the BLOOMIN device
+            session: Session to send requests with; it is never closed here
             wake_endpoint: Custom wake endpoint path (e.g., "/api/wake")
         """
         self.ip_address = ip_address
         self.base_url = f"http://{ip_address}"
+        # Parsed once; request URLs are derived from it without re-parsing strings
+        self._base_url = URL(self.base_url)
         self.wake_endpoint = wake_endpoint or "/api/wake"
+        self._session = session
+        # Requests in flight to this device (HTTP_MAX_CONNECTIONS_PER_HOST)
+        self._host_semaphore = asyncio.Semaphore(HTTP_MAX_CONNECTIONS_PER_HOST)
+
+    @property
+    def wake_endpoint(self) -> str:
+        """Wake endpoint path."""
+        return self._wake_endpoint
+
+    @wake_endpoint.setter
+    def wake_endpoint(self, path: str) -> None:
+        self._wake_endpoint = path
+        self._wake_url = self._base_url.with_path(path)
 
+    @_http_guard("wake", False)
     async def wake_device(self) -> bool:
         """Wake up the BLOOMIN device.
         
@@ -36,31 +155,115 @@ class BloominAPI:
         API endpoint may vary based on actual BLOOMIN device firmware.
         Common endpoints: /api/wake, /wake, /api/ping
         """
-        try:
-            # Note: Endpoint may be discovered during setup or use default
-            url = f"{self.base_url}{self.wake_endpoint}"
-            _LOGGER.debug("Attempting to wake device via HTTP API: %s", url)
+        # Note: Endpoint may be discovered during setup or use default
+        url = self._wake_url
+        _LOGGER.debug("Attempting to wake device via HTTP API: %s", url)
+        
+        async with _wake_semaphore(), self._host_semaphore:
+            # Try without Content-Type header first (some devices don't accept JSON)
+            async with self._session.post(
+                url,
+                timeout=_NORMAL_TIMEOUT
+            ) as response:
+                success = response.status == 200
+                # The body is only needed for logging; skip reading it when nothing is logged
+                if success and not _LOGGER.isEnabledFor(logging.DEBUG):
+                    response.release()
+                else:
+                    response_text = (await response.text())[:100]
+                    _LOGGER.debug("Wake response: HTTP %s, body: %s", response.status, response_text)
+                
+                if success:
+                    _LOGGER.info("Successfully woke device via HTTP API")
+                else:
+                    _LOGGER.warning("Wake request returned HTTP %s: %s", response.status, response_text)
+                return success
+
+    @_http_guard("endpoint probe", None, level=logging.DEBUG)
+    async def _probe(self, path: str) -> tuple[str, int] | None:
+        """Probe a single endpoint and return (path, HTTP status), or None if unreachable.
+        
+        Only safe methods are used, so probing never triggers a device action:
+        OPTIONS first, which is meant for capability probing, then HEAD when
+        the OPTIONS answer says nothing about the path.
+        """
+        url = self._base_url.with_path(path)
+        async with self._host_semaphore:
+            async with self._session.options(
+                url,
+                timeout=_PROBE_TIMEOUT
+            ) as response:
+                status = response.status
+            if status == 404 or status in _PROBE_OK_STATUSES:
+                return path, status
             
-            async with aiohttp.ClientSession() as session:
-                # Try without Content-Type header first (some devices don't accept JSON)
-                async with session.post(
-                    url,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as response:
-                    response_text = await response.text()
-                    _LOGGER.debug("Wake response: HTTP %s, body: %s", response.status, response_text[:100])
-                    
-                    success = response.status == 200
-                    if success:
-                        _LOGGER.info("Successfully woke device via HTTP API")
-                    else:
-                        _LOGGER.warning("Wake request returned HTTP %s: %s", response.status, response_text[:100])
-                    return success
-        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-            _LOGGER.error("Network error waking device: %s", e)
-            return False
-        except Exception as e:
-            _LOGGER.error("Unexpected error waking device: %s", e)
-            return False
+            _LOGGER.debug("OPTIONS probe for %s was inconclusive (HTTP %s), retrying with HEAD", path, status)
+            async with self._session.head(
+                url,
+                timeout=_PROBE_TIMEOUT
+            ) as response:
+                return path, response.status
 
+    async def discover_api_endpoints(self) -> dict[str, str]:
+        """Discover which API endpoints the device firmware exposes.
+        
+        All candidates are probed concurrently, but they are accepted in
+        WAKE_ENDPOINT_CANDIDATES order, so the result does not depend on which
+        probe answers first; the remaining probes are cancelled once one is
+        accepted. If a discovery for the same
+        device is already running (e.g. two setups at once), its result is
+        awaited instead of probing again.
+        
+        Returns:
+            Dictionary mapping endpoint type ("wake") to path; empty if no candidate
+            answered differently from a missing path (callers keep the default)
+        """
+        task = _DISCOVERY_TASKS.get(self.ip_address)
+        if task is None:
+            task = asyncio.create_task(self._discover_api_endpoints())
+            _DISCOVERY_TASKS[self.ip_address] = task
+            task.add_done_callback(
+                lambda _: _DISCOVERY_TASKS.pop(self.ip_address, None)
+            )
+        else:
+            _LOGGER.debug("Joining API endpoint discovery already running for: %s", self.ip_address)
+        # Shield so one caller giving up does not cancel the others' discovery
+        return dict(await asyncio.shield(task))
 
+    async def _discover_api_endpoints(self) -> dict[str, str]:
+        """Probe every wake endpoint candidate (see discover_api_endpoints)."""
+        _LOGGER.debug("Discovering API endpoints for device: %s", self.ip_address)
+        discovered: dict[str, str] = {}
+        
+        missing_task = asyncio.create_task(self._probe(_PROBE_MISSING_PATH))
+        tasks = [asyncio.create_task(self._probe(path)) for path in WAKE_ENDPOINT_CANDIDATES]
+        try:
+            missing = await missing_task
+            missing_status = missing[1] if missing is not None else None
+            _LOGGER.debug("Missing-path probe: HTTP %s", missing_status)
+            
+            # A candidate is only accepted once every higher-priority one is ruled out
+            for task in tasks:
+                result = await task
+                if result is None:
+                    continue
+                path, status = result
+                _LOGGER.debug("Endpoint probe %s: HTTP %s", path, status)
+                if status == missing_status:
+                    # Indistinguishable from a path that does not exist
+                    continue
+                if status in _PROBE_OK_STATUSES:
+                    discovered["wake"] = path
+                    _LOGGER.debug("Discovered %s endpoint: %s", "wake", path)
+                    break
+        finally:
+            tasks.append(missing_task)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        if discovered:
+            _LOGGER.info("API endpoint discovery successful: %s", discovered)
+        else:
+            _LOGGER.warning("No API endpoints discovered for device: %s", self.ip_address)
+        return discovered
@@ -3,6 +3,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import stat
+import time
 from typing import Any
 
 import aiohttp
@@ -14,8 +17,12 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import selector
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
+    API_ENDPOINT_CACHE_TTL,
+    BLE_MAC_ADDRESS_RE,
+    CONF_API_WAKE_ENDPOINT,
     CONF_BLE_CHARACTERISTIC_UUID,
     CONF_BLE_MAC_ADDRESS,
     CONF_BLE_SERVICE_UUID,
@@ -45,17 +52,258 @@ from .const import (
     DOMAIN,
     IMAGE_SOURCE_FILE,
     IMAGE_SOURCE_FOLDER,
-    OVERLAY_POSITION_BOTTOM_RIGHT,
-    OVERLAY_POSITION_BOTTOM_LEFT,
-    OVERLAY_POSITION_TOP_RIGHT,
-    OVERLAY_POSITION_TOP_LEFT,
-    OVERLAY_STYLE_BADGE,
-    OVERLAY_STYLE_TEXT,
-    OVERLAY_STYLE_ICON,
+)
+from .flow_selectors import (
+    IMAGE_SOURCE_SELECTOR,
+    OVERLAY_POSITION_SELECTOR,
+    OVERLAY_STYLE_SELECTOR,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fields shown on every render of the user step; the image source and BLE MAC
+# fields are added per render in async_step_user
+_USER_BASE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME, default="BLOOMIN Presence Display"): str,
+        vol.Required(CONF_BLOOMIN_IP): str,
+        vol.Required(CONF_PERSON_ENTITIES, default=[]): selector.EntitySelector(
+            selector.EntitySelectorConfig(
+                domain="person",
+                multiple=True,
+                filter={"domain": "person"}
+            )
+        ),
+        vol.Required(
+            CONF_IMAGE_SOURCE, default=DEFAULT_IMAGE_SOURCE
+        ): IMAGE_SOURCE_SELECTOR,
+        vol.Optional(CONF_USE_BLE_WAKE, default=False): bool,
+        vol.Optional(
+            CONF_OVERLAY_POSITION, default=DEFAULT_OVERLAY_POSITION
+        ): OVERLAY_POSITION_SELECTOR,
+        vol.Optional(
+            CONF_OVERLAY_STYLE, default=DEFAULT_OVERLAY_STYLE
+        ): OVERLAY_STYLE_SELECTOR,
+        vol.Optional(
+            CONF_IMAGE_QUALITY, default=DEFAULT_IMAGE_QUALITY
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+        vol.Optional(
+            CONF_OVERLAY_BADGE_SIZE, default=DEFAULT_OVERLAY_BADGE_SIZE
+        ): vol.All(vol.Coerce(int), vol.Range(min=10, max=200)),
+        vol.Optional(
+            CONF_OVERLAY_ICON_SIZE, default=DEFAULT_OVERLAY_ICON_SIZE
+        ): vol.All(vol.Coerce(int), vol.Range(min=10, max=200)),
+        vol.Optional(
+            CONF_OVERLAY_FONT_SIZE, default=DEFAULT_OVERLAY_FONT_SIZE
+        ): vol.All(vol.Coerce(int), vol.Range(min=8, max=72)),
+        vol.Optional(
+            CONF_OVERLAY_MARGIN, default=DEFAULT_OVERLAY_MARGIN
+        ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
+    }
+)
+
+
+async def _try_ble(hass: HomeAssistant, data: dict[str, Any]) -> str | None:
+    """Test BLE wake, storing discovered UUIDs in data. Returns the method name on success."""
+    ble_mac_address = data.get(CONF_BLE_MAC_ADDRESS, "")
+    try:
+        from .ble_wake import discover_ble_services, wake_device_via_ble
+        
+        # Try to discover BLE services and characteristics (optional)
+        # If discovery fails, default UUIDs will be used which should work for BLOOMIN8
+        _LOGGER.debug("Attempting BLE service discovery during setup: %s", ble_mac_address)
+        discovered = await discover_ble_services(hass, ble_mac_address, timeout=5.0)
+        
+        if discovered:
+            # Store discovered UUIDs in data
+            data[CONF_BLE_SERVICE_UUID] = discovered["service_uuid"]
+            data[CONF_BLE_CHARACTERISTIC_UUID] = discovered["characteristic_uuid"]
+            _LOGGER.debug(
+                "BLE discovery successful: service=%s, characteristic=%s",
+                discovered["service_uuid"],
+                discovered["characteristic_uuid"]
+            )
+        else:
+            # This is OK - default UUIDs are known to work for BLOOMIN8
+            # Import default UUID from ble_wake module
+            from .ble_wake import DEFAULT_BLE_CHARACTERISTIC_UUID
+            _LOGGER.debug(
+                "BLE discovery skipped or failed (this is OK). "
+                "Will use default UUIDs: characteristic=%s",
+                DEFAULT_BLE_CHARACTERISTIC_UUID
+            )
+        
+        # Test BLE wake with discovered or default UUIDs
+        _LOGGER.debug("Testing BLE wake during setup: %s", ble_mac_address)
+        if await wake_device_via_ble(
+            hass,
+            ble_mac_address,
+            data.get(CONF_BLE_SERVICE_UUID),
+            data.get(CONF_BLE_CHARACTERISTIC_UUID),
+            timeout=5.0
+        ):
+            _LOGGER.debug("BLE wake test successful during setup")
+            return "BLE"
+        _LOGGER.warning("BLE wake test failed")
+    except Exception as e:
+        _LOGGER.warning("BLE wake test error: %s", e)
+    return None
+
+
+async def _try_whistle(hass: HomeAssistant, data: dict[str, Any]) -> str | None:
+    """Test the eink_display.whistle service. Returns the method name on success."""
+    bloomin_ip = data.get(CONF_BLOOMIN_IP)
+    entity_registry = er.async_get(hass)
+    try:
+        # Find BLOOMIN entity by IP: match the config entry first, then only
+        # look at that entry's entities instead of scanning the whole registry
+        for config_entry in hass.config_entries.async_entries("bloomin8_eink_canvas"):
+            if config_entry.data.get("host") != bloomin_ip:
+                continue
+            for entity in er.async_entries_for_config_entry(entity_registry, config_entry.entry_id):
+                try:
+                    await hass.services.async_call(
+                        "eink_display",
+                        "whistle",
+                        {"entity_id": entity.entity_id},
+                    )
+                    _LOGGER.debug("eink_display.whistle test successful during setup")
+                    return "eink_display.whistle"
+                except (ValueError, AttributeError, KeyError) as e:
+                    _LOGGER.debug("eink_display.whistle test error (invalid parameters): %s", e)
+                except Exception as e:
+                    _LOGGER.debug("eink_display.whistle test error: %s", e)
+    except Exception as e:
+        _LOGGER.debug("eink_display.whistle service lookup error: %s", e)
+    return None
+
+
+def _cached_endpoints(hass: HomeAssistant, bloomin_ip: str) -> dict[str, str] | None:
+    """Return endpoints discovered for bloomin_ip within the TTL, or None."""
+    from .coordinator import BloominData
+    
+    data = hass.data.get(DOMAIN)
+    if not isinstance(data, BloominData):
+        return None
+    cached = data.endpoint_cache.get(bloomin_ip)
+    if cached is None:
+        return None
+    discovered_at, endpoints = cached
+    if time.monotonic() - discovered_at > API_ENDPOINT_CACHE_TTL:
+        data.endpoint_cache.pop(bloomin_ip, None)
+        return None
+    return endpoints
+
+
+def _store_endpoints(hass: HomeAssistant, bloomin_ip: str, endpoints: dict[str, str]) -> None:
+    """Remember discovered endpoints so the next setup skips the probes."""
+    from .coordinator import BloominData
+    
+    # Nothing found is not cached, so a device that was asleep is probed again
+    if not endpoints:
+        return
+    data = hass.data.setdefault(DOMAIN, BloominData())
+    data.endpoint_cache[bloomin_ip] = (time.monotonic(), endpoints)
+
+
+async def _async_discover_endpoints(hass: HomeAssistant, bloomin_ip: str) -> dict[str, str]:
+    """Return the API endpoints the device exposes, reusing a recent discovery."""
+    from .bloomin_api import BloominAPI
+    
+    # A recent discovery for the same IP (e.g. before a reload) is reused
+    discovered_endpoints = _cached_endpoints(hass, bloomin_ip)
+    if discovered_endpoints is None:
+        api = BloominAPI.get(bloomin_ip, async_get_clientsession(hass))
+        discovered_endpoints = await api.discover_api_endpoints()
+        _store_endpoints(hass, bloomin_ip, discovered_endpoints)
+    else:
+        _LOGGER.debug("Using cached API endpoints for %s: %s", bloomin_ip, discovered_endpoints)
+    return discovered_endpoints
+
+
+async def _try_http_api(
+    hass: HomeAssistant, data: dict[str, Any], discovery: asyncio.Task[dict[str, str]]
+) -> str | None:
+    """Test HTTP API wake with the endpoint from discovery. Returns the method name on success."""
+    bloomin_ip = data.get(CONF_BLOOMIN_IP)
+    try:
+        from .bloomin_api import BloominAPI
+        
+        # Note: Image upload is handled by bloomin8_eink_canvas integration via media_player.play_media
+        # We only test wake functionality here (HTTP API fallback)
+        _LOGGER.debug("Testing HTTP API wake for device: %s", bloomin_ip)
+        # Shielded: if another method wins and this attempt is cancelled, the
+        # discovery still finishes and _async_test_wake stores its endpoint
+        discovered_endpoints = await asyncio.shield(discovery)
+        api = BloominAPI.get(
+            bloomin_ip, async_get_clientsession(hass), wake_endpoint=discovered_endpoints.get("wake")
+        )
+        if await api.wake_device():
+            _LOGGER.debug("HTTP API wake test successful during setup")
+            return "HTTP API"
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        _LOGGER.debug("HTTP API wake test network error: %s", e)
+    except Exception as e:
+        _LOGGER.debug("HTTP API wake test error: %s", e)
+    return None
+
+
+async def _async_test_wake(hass: HomeAssistant, data: dict[str, Any]) -> str | None:
+    """Try every wake method at once and return the first that succeeds.
+    
+    Any single success proves the device is reachable, so the methods race
+    and the losers are cancelled. Setup waits for the fastest method rather
+    than the sum of all of them. Results that complete together are
+    reported in priority order: BLE (matching bloomin8_bt_wake), then
+    eink_display.whistle, then the HTTP API.
+    
+    The HTTP endpoint discovery runs as its own task and is not cancelled
+    with a losing HTTP attempt; its wake endpoint is stored in data after
+    the race, whichever method won.
+    
+    Returns:
+        Name of the wake method that worked, or None if all failed
+    """
+    discovery = asyncio.create_task(_async_discover_endpoints(hass, data.get(CONF_BLOOMIN_IP)))
+    attempts = []
+    if data.get(CONF_USE_BLE_WAKE, False) and data.get(CONF_BLE_MAC_ADDRESS, ""):
+        attempts.append(_try_ble(hass, data))
+    attempts.append(_try_whistle(hass, data))
+    attempts.append(_try_http_api(hass, data, discovery))
+    
+    tasks = [asyncio.create_task(attempt) for attempt in attempts]
+    pending = set(tasks)
+    method: str | None = None
+    try:
+        try:
+            while pending and method is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                method = next(
+                    (
+                        task.result()
+                        for task in tasks
+                        if task in done and task.exception() is None and task.result()
+                    ),
+                    None,
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # Stored for the coordinator
+        try:
+            discovered_endpoints = await discovery
+        except Exception as e:
+            _LOGGER.debug("API endpoint discovery error: %s", e)
+        else:
+            if "wake" in discovered_endpoints:
+                data[CONF_API_WAKE_ENDPOINT] = discovered_endpoints["wake"]
+        return method
+    finally:
+        # Only still running if the flow itself was cancelled
+        discovery.cancel()
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input and test connection."""
@@ -100,7 +348,7 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
             try:
                 folder_path.mkdir(parents=True, exist_ok=True)
                 _LOGGER.info("Created media folder: %s", folder_path)
-            except (OSError, PermissionError) as e:
+            except OSError as e:
                 _LOGGER.warning("Failed to create media folder %s: %s. User should create it manually.", folder_path, e)
                 # Don't raise error - allow setup to continue
     elif image_source == IMAGE_SOURCE_FILE:
@@ -109,17 +357,19 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         if not image_path:
             raise ValueError("image_path_required")
         
-        # Check if file exists
-        from pathlib import Path
-        if Path(image_path).is_absolute():
-            check_path = Path(image_path)
+        # Check if file exists (one stat call answers both exists and is-file)
+        if os.path.isabs(image_path):
+            check_path = image_path
         else:
-            media_dir = Path(hass.config.media_dirs.get("local", hass.config.path("media")))
-            check_path = media_dir / image_path
+            media_dir = hass.config.media_dirs.get("local") or hass.config.path("media")
+            check_path = os.path.join(media_dir, image_path)
         
-        if not check_path.exists():
-            raise ValueError("image_path_not_found")
-        if not check_path.is_file():
+        try:
+            st = await hass.async_add_executor_job(os.stat, check_path)
+        except OSError:
+            # Missing, a parent is not a directory, or not accessible
+            raise ValueError("image_path_not_found") from None
+        if not stat.S_ISREG(st.st_mode):
             raise ValueError("image_path_not_file")
     
     # Validate BLE MAC address format if BLE wake is enabled
@@ -128,116 +378,19 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         if not mac_address:
             raise ValueError("ble_mac_address_required")
         # Basic MAC address format validation (XX:XX:XX:XX:XX:XX)
-        mac_normalized = mac_address.upper().replace("-", ":").replace("_", ":")
-        parts = mac_normalized.split(":")
-        if len(parts) != 6 or not all(len(part) == 2 and all(c in "0123456789ABCDEF" for c in part) for part in parts):
+        if not BLE_MAC_ADDRESS_RE.fullmatch(mac_address):
             raise ValueError("invalid_ble_mac_address")
     
     # Test wake functionality to verify device connection
     # This helps ensure the device is reachable before completing setup
-    # Priority: BLE wake FIRST (matching bloomin8_bt_wake), then WiFi-based methods
-    bloomin_ip = data.get(CONF_BLOOMIN_IP)
-    use_ble_wake = data.get(CONF_USE_BLE_WAKE, False)
-    ble_mac_address = data.get(CONF_BLE_MAC_ADDRESS, "")
-    
-    wake_success = False
-    wake_method_used = None
-    
-    # Priority 1: BLE wake MUST be tried first if enabled (matching bloomin8_bt_wake)
-    if use_ble_wake and ble_mac_address:
-        try:
-            from .ble_wake import discover_ble_services, wake_device_via_ble
-            
-            # Try to discover BLE services and characteristics (optional)
-            # If discovery fails, default UUIDs will be used which should work for BLOOMIN8
-            _LOGGER.debug("Attempting BLE service discovery during setup: %s", ble_mac_address)
-            discovered = await discover_ble_services(ble_mac_address, timeout=5.0)
-            
-            if discovered:
-                # Store discovered UUIDs in data
-                data[CONF_BLE_SERVICE_UUID] = discovered["service_uuid"]
-                data[CONF_BLE_CHARACTERISTIC_UUID] = discovered["characteristic_uuid"]
-                _LOGGER.info(
-                    "BLE discovery successful: service=%s, characteristic=%s",
-                    discovered["service_uuid"],
-                    discovered["characteristic_uuid"]
-                )
-            else:
-                # This is OK - default UUIDs are known to work for BLOOMIN8
-                # Import default UUID from ble_wake module
-                from .ble_wake import DEFAULT_BLE_CHARACTERISTIC_UUID
-                _LOGGER.debug(
-                    "BLE discovery skipped or failed (this is OK). "
-                    "Will use default UUIDs: characteristic=%s",
-                    DEFAULT_BLE_CHARACTERISTIC_UUID
-                )
-            
-            # Test BLE wake with discovered or default UUIDs
-            _LOGGER.info("Testing BLE wake during setup: %s", ble_mac_address)
-            wake_success = await wake_device_via_ble(
-                ble_mac_address,
-                data.get(CONF_BLE_SERVICE_UUID),
-                data.get(CONF_BLE_CHARACTERISTIC_UUID),
-                timeout=5.0
-            )
-            if wake_success:
-                _LOGGER.info("BLE wake test successful during setup")
-                wake_method_used = "BLE"
-            else:
-                _LOGGER.warning("BLE wake test failed, trying WiFi-based fallback methods")
-        except Exception as e:
-            _LOGGER.warning("BLE wake test error: %s. Trying WiFi-based fallback methods.", e)
-    
-    # Priority 2: Try WiFi-based wake methods as fallback (if BLE wake failed or not enabled)
-    if not wake_success:
-        # Try eink_display.whistle service
-        try:
-            # Find BLOOMIN entity by IP
-            for entity_id, entity in entity_registry.entities.items():
-                if entity.platform == "bloomin8_eink_canvas" or "bloomin" in entity_id.lower():
-                    if hasattr(entity, "config_entry_id") and entity.config_entry_id:
-                        config_entry = hass.config_entries.async_get_entry(entity.config_entry_id)
-                        if config_entry and config_entry.data.get("host") == bloomin_ip:
-                            try:
-                                await hass.services.async_call(
-                                    "eink_display",
-                                    "whistle",
-                                    {"entity_id": entity_id},
-                                )
-                                wake_success = True
-                                wake_method_used = "eink_display.whistle"
-                                _LOGGER.info("eink_display.whistle test successful during setup")
-                                break
-                            except (ValueError, AttributeError, KeyError) as e:
-                                _LOGGER.debug("eink_display.whistle test error (invalid parameters): %s", e)
-                            except Exception as e:
-                                _LOGGER.debug("eink_display.whistle test error: %s", e)
-        except Exception as e:
-            _LOGGER.debug("eink_display.whistle service lookup error: %s", e)
-    
-    # Priority 3: Try HTTP API wake as fallback
-    if not wake_success:
-        try:
-            from .bloomin_api import BloominAPI
-            
-            # Note: Image upload is handled by bloomin8_eink_canvas integration via media_player.play_media
-            # We only test wake functionality here (HTTP API fallback)
-            _LOGGER.debug("Testing HTTP API wake for device: %s", bloomin_ip)
-            api = BloominAPI(bloomin_ip)
-            wake_success = await api.wake_device()
-            if wake_success:
-                wake_method_used = "HTTP API"
-                _LOGGER.info("HTTP API wake test successful during setup")
-        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-            _LOGGER.debug("HTTP API wake test network error: %s", e)
-        except Exception as e:
-            _LOGGER.debug("HTTP API wake test error: %s", e)
+    wake_method_used = await _async_test_wake(hass, data)
+    wake_success = wake_method_used is not None
     
     # Log result
     if wake_success:
         _LOGGER.info(
             "Device wake test successful using %s. Setup can proceed.",
-            wake_method_used or "unknown method"
+            wake_method_used
         )
     else:
         _LOGGER.warning(
@@ -292,72 +445,7 @@ class BloominPresenceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input:
             image_source = user_input.get(CONF_IMAGE_SOURCE, DEFAULT_IMAGE_SOURCE)
         
-        schema_dict = {
-            vol.Required(CONF_NAME, default="BLOOMIN Presence Display"): str,
-            vol.Required(CONF_BLOOMIN_IP): str,
-            vol.Required(
-                CONF_PERSON_ENTITIES,
-                default=user_input.get(CONF_PERSON_ENTITIES, []) if user_input else []
-            ): selector.EntitySelector(
-                selector.EntitySelectorConfig(
-                    domain="person",
-                    multiple=True,
-                    filter={"domain": "person"}
-                )
-            ),
-            vol.Required(
-                CONF_IMAGE_SOURCE, default=DEFAULT_IMAGE_SOURCE
-            ): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=[
-                        IMAGE_SOURCE_FOLDER,
-                        IMAGE_SOURCE_FILE,
-                    ],
-                    translation_key="image_source",
-                )
-            ),
-            vol.Optional(CONF_USE_BLE_WAKE, default=False): bool,
-            vol.Optional(
-                CONF_OVERLAY_POSITION, default=DEFAULT_OVERLAY_POSITION
-            ): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=[
-                        OVERLAY_POSITION_BOTTOM_RIGHT,
-                        OVERLAY_POSITION_BOTTOM_LEFT,
-                        OVERLAY_POSITION_TOP_RIGHT,
-                        OVERLAY_POSITION_TOP_LEFT,
-                    ],
-                    translation_key="overlay_position",
-                )
-            ),
-            vol.Optional(
-                CONF_OVERLAY_STYLE, default=DEFAULT_OVERLAY_STYLE
-            ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            OVERLAY_STYLE_BADGE,
-                            OVERLAY_STYLE_TEXT,
-                            OVERLAY_STYLE_ICON,
-                        ],
-                        translation_key="overlay_style",
-                    )
-                ),
-            vol.Optional(
-                CONF_IMAGE_QUALITY, default=DEFAULT_IMAGE_QUALITY
-            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
-            vol.Optional(
-                CONF_OVERLAY_BADGE_SIZE, default=DEFAULT_OVERLAY_BADGE_SIZE
-            ): vol.All(vol.Coerce(int), vol.Range(min=10, max=200)),
-            vol.Optional(
-                CONF_OVERLAY_ICON_SIZE, default=DEFAULT_OVERLAY_ICON_SIZE
-            ): vol.All(vol.Coerce(int), vol.Range(min=10, max=200)),
-            vol.Optional(
-                CONF_OVERLAY_FONT_SIZE, default=DEFAULT_OVERLAY_FONT_SIZE
-            ): vol.All(vol.Coerce(int), vol.Range(min=8, max=72)),
-            vol.Optional(
-                CONF_OVERLAY_MARGIN, default=DEFAULT_OVERLAY_MARGIN
-            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
-        }
+        schema_dict: dict[Any, Any] = {}
         
         # Conditionally add image source specific fields
         if image_source == IMAGE_SOURCE_FOLDER:
@@ -378,7 +466,13 @@ class BloominPresenceConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         else:
             schema_dict[vol.Optional(CONF_BLE_MAC_ADDRESS)] = str
 
-        data_schema = vol.Schema(schema_dict)
+        data_schema = _USER_BASE_SCHEMA.extend(schema_dict)
+        if user_input:
+            # Keep the selected persons when the form is shown again with errors
+            data_schema = self.add_suggested_values_to_schema(
+                data_schema,
+                {CONF_PERSON_ENTITIES: user_input.get(CONF_PERSON_ENTITIES, [])},
+            )
 
         return self.async_show_form(
             step_id="user", data_schema=data_schema, errors=errors
@@ -1,4 +1,5 @@
 """Constants for BLOOMIN Presence Display integration."""
+import re
 from typing import Final
 
 DOMAIN: Final = "bloomin_presence_display"
@@ -21,6 +22,7 @@ CONF_OVERLAY_BADGE_SIZE: Final = "overlay_badge_size"
 CONF_OVERLAY_ICON_SIZE: Final = "overlay_icon_size"
 CONF_OVERLAY_FONT_SIZE: Final = "overlay_font_size"
 CONF_OVERLAY_MARGIN: Final = "overlay_margin"
+CONF_API_WAKE_ENDPOINT: Final = "api_wake_endpoint"
 
 # Default values
 DEFAULT_MEDIA_FOLDER: Final = "bloomin_display"
@@ -33,6 +35,12 @@ DEFAULT_OVERLAY_ICON_SIZE: Final = 32
 DEFAULT_OVERLAY_FONT_SIZE: Final = 16
 DEFAULT_OVERLAY_MARGIN: Final = 15
 
+# Discovered HTTP API endpoints are reused for this long (seconds)
+API_ENDPOINT_CACHE_TTL: Final = 24 * 60 * 60
+
+# BLE MAC address: six hex octets separated by ":", "-" or "_"
+BLE_MAC_ADDRESS_RE: Final = re.compile(r"[0-9A-Fa-f]{2}([:\-_][0-9A-Fa-f]{2}){5}")
+
 # Image source options
 IMAGE_SOURCE_FOLDER: Final = "folder"
 IMAGE_SOURCE_FILE: Final = "file"
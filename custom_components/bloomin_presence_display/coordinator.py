@@ -2,14 +2,26 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 import logging
+import os
 from pathlib import Path
+import random
+import re
+import shutil
+import stat
+import time
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import entity_registry as er
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er, translation
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
+    CONF_API_WAKE_ENDPOINT,
     CONF_BLE_CHARACTERISTIC_UUID,
     CONF_BLE_MAC_ADDRESS,
     CONF_BLE_SERVICE_UUID,
@@ -37,11 +49,82 @@ from .const import (
 )
 from .image_processor import ImageProcessor
 from .bloomin_api import BloominAPI
-from .ble_wake import wake_device_via_ble
+from .ble_wake import BloominBleSession, wake_device_via_ble
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# Image file extensions picked up from the media folder (without the dot)
+_IMAGE_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "bmp"})
+
+_MEDIA_PLAYER_PREFIX = "media_player."
+# Entity IDs that look like a BLOOMIN display, matched in a single pass
+_BLOOMIN_NAME_RE = re.compile(r"bloomin|eink")
+
+# Seconds after a successful upload during which the display is assumed awake
+WAKE_CACHE_SECONDS = 60
+
+# Processed images kept per entry in the output folder; older ones are deleted
+OUTPUT_IMAGES_TO_KEEP = 3
+
+
+def _copy_file_atomic(source: str, output_path: str) -> int:
+    """Copy source to output_path via a temporary file; return the copy's size.
+    
+    Like ImageProcessor.save_presence_overlay, readers never see a partial file.
+    """
+    tmp_path = f"{output_path}.tmp"
+    try:
+        shutil.copyfile(source, tmp_path)
+        size = os.stat(tmp_path).st_size
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return size
+
+
+def _prune_output_images(output_dir: Path, prefix: str, keep: int) -> None:
+    """Delete all but the newest `keep` images whose name starts with prefix."""
+    with os.scandir(output_dir) as entries:
+        images = sorted(
+            (entry.name for entry in entries
+             if entry.name.startswith(prefix) and entry.name.endswith(".jpg")),
+            # Names end in a millisecond timestamp, compare it numerically
+            key=lambda name: int(name[len(prefix):-4]) if name[len(prefix):-4].isdigit() else 0,
+        )
+    for name in images[:-keep]:
+        try:
+            os.unlink(output_dir / name)
+        except FileNotFoundError:
+            pass
+
+
+def _probe_path(path: Path) -> tuple[bool, bool, bool]:
+    """Return (exists, is_file, is_dir) for path from a single stat call."""
+    try:
+        st = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return False, False, False
+    return True, stat.S_ISREG(st.st_mode), stat.S_ISDIR(st.st_mode)
+
+
+@dataclass
+class BloominData:
+    """Runtime data stored in hass.data[DOMAIN]."""
+
+    coordinators: dict[str, BloominPresenceCoordinator] = field(default_factory=dict)
+    services_setup: bool = False
+    services_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # bloomin_ip -> (monotonic time of discovery, discovered endpoints)
+    endpoint_cache: dict[str, tuple[float, dict[str, str]]] = field(default_factory=dict)
+    # config entry title -> entry_id, to resolve service calls that target a title
+    entry_ids_by_title: dict[str, str] = field(default_factory=dict)
+
+
 class BloominPresenceCoordinator:
     """Class to manage BLOOMIN Presence Display operations."""
 
@@ -60,31 +143,98 @@ class BloominPresenceCoordinator:
         self.image_source = entry.data.get(CONF_IMAGE_SOURCE, IMAGE_SOURCE_FOLDER)
         self.media_folder = entry.data.get(CONF_MEDIA_FOLDER, "bloomin_display")
         self.image_path = entry.data.get(CONF_IMAGE_PATH, "")
+        # Local media directory (falls back to <config>/media), resolved once
+        self._local_media_dir = Path(
+            hass.config.media_dirs.get("local") or hass.config.path("media")
+        )
         self.use_ble_wake = entry.data.get(CONF_USE_BLE_WAKE, False)
         self.ble_mac_address = entry.data.get(CONF_BLE_MAC_ADDRESS, "")
         self.ble_service_uuid = entry.data.get(CONF_BLE_SERVICE_UUID)
         self.ble_characteristic_uuid = entry.data.get(CONF_BLE_CHARACTERISTIC_UUID)
         
         # Initialize API client (only used for wake functionality)
-        wake_endpoint = entry.data.get("api_wake_endpoint")
-        self.bloomin_api = BloominAPI(self.bloomin_ip, wake_endpoint=wake_endpoint)
+        wake_endpoint = entry.data.get(CONF_API_WAKE_ENDPOINT)
+        self.bloomin_api = BloominAPI.get(
+            self.bloomin_ip,
+            wake_endpoint=wake_endpoint,
+            session=async_get_clientsession(hass),
+        )
         self.image_processor = ImageProcessor(self.hass)
+        # Overlay rendering is CPU-bound; a single dedicated worker keeps it from
+        # queueing ahead of the small file checks in Home Assistant's executor
+        self._image_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="bloomin_img"
+        )
+        
+        # (folder path, folder mtime_ns, image files) from the last folder scan
+        self._image_list_cache: tuple[Path, int, list[str]] | None = None
+        
+        # media_player entity of the BLOOMIN device; reset when a media_player entry changes
+        self._bloomin_entity: str | None = None
+        self._unsub_registry_updated = hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_registry_updated
+        )
+        
+        # Translations for the overlay texts, fetched in the background
+        self._translations_language: str | None = None
+        self._translations_task: asyncio.Task[dict[str, str]] | None = None
+        self._translations_task_for(hass.config.language)
+        
+        # (options, data, language, overlay config, image quality) of the last upload
+        self._overlay_config_cache: tuple[
+            Mapping[str, Any], Mapping[str, Any], str, dict[str, Any], int
+        ] | None = None
+        
+        # Index of the media_content_id format the media_player accepted last
+        self._media_content_id_format: int | None = None
+        
+        # time.monotonic() of the last successful upload, to skip redundant wakes
+        self._last_successful_upload = 0.0
+        
+        # (render inputs, output file) of the last render, to reuse it for identical inputs
+        self._last_render: tuple[tuple[Any, ...], Path] | None = None
+        
+        # Own generator for image picks instead of the module-global shared state
+        self._random = random.Random()
+        
+        # Folders are created on first use, not checked on every upload
+        self._media_folder_ready = False
+        self._output_dir_ready = False
+        
+        # Persistent BLE connection reused across wake calls
+        self.ble_session: BloominBleSession | None = None
+        if self.use_ble_wake and self.ble_mac_address:
+            self.ble_session = BloominBleSession(self.hass, self.ble_mac_address)
+
+    async def async_shutdown(self) -> None:
+        """Release resources held by the coordinator."""
+        self._unsub_registry_updated()
+        self._image_executor.shutdown(wait=False)
+        if self._translations_task is not None and not self._translations_task.done():
+            self._translations_task.cancel()
+        if self.ble_session is not None:
+            await self.ble_session.close()
 
     def get_media_folder_path(self) -> Path:
-        """Get the full path to the media folder. Creates folder if it doesn't exist."""
-        media_dir = Path(self.hass.config.media_dirs.get("local", self.hass.config.path("media")))
-        folder_path = media_dir / self.media_folder
-        
-        # Create folder if it doesn't exist
+        """Get the full path to the media folder."""
+        return self._local_media_dir / self.media_folder
+
+    @staticmethod
+    def _create_media_folder(folder_path: Path) -> None:
+        """Create the media folder if it doesn't exist (runs in the executor)."""
         if not folder_path.exists():
             try:
                 folder_path.mkdir(parents=True, exist_ok=True)
                 _LOGGER.info("Created media folder: %s", folder_path)
-            except (OSError, PermissionError) as e:
+            except OSError as e:
                 _LOGGER.error("Failed to create media folder %s: %s", folder_path, e)
                 raise
-        
-        return folder_path
+
+    def _configured_image_path(self) -> Path:
+        """Return the configured file-source image (absolute, or relative to the media directory)."""
+        if Path(self.image_path).is_absolute():
+            return Path(self.image_path)
+        return self._local_media_dir / self.image_path
 
     async def get_image_path(self) -> Path | None:
         """Get image path based on image source setting."""
@@ -98,23 +248,15 @@ class BloominPresenceCoordinator:
             
             _LOGGER.debug("Using file source mode, image_path: %s", self.image_path)
             
-            # Handle both absolute and relative paths
-            if Path(self.image_path).is_absolute():
-                image_path = Path(self.image_path)
-                _LOGGER.debug("Using absolute path: %s", image_path)
-            else:
-                # Relative to media directory
-                media_dir = Path(self.hass.config.media_dirs.get("local", self.hass.config.path("media")))
-                image_path = media_dir / self.image_path
-                _LOGGER.debug("Using relative path (media_dir: %s, final: %s)", media_dir, image_path)
+            image_path = self._configured_image_path()
+            _LOGGER.debug("Resolved image path: %s", image_path)
             
             # Check existence in thread pool to avoid blocking
-            exists = await asyncio.to_thread(image_path.exists)
+            exists, is_file, _ = await asyncio.to_thread(_probe_path, image_path)
             if not exists:
                 _LOGGER.error("Image file does not exist: %s", image_path)
                 return None
             
-            is_file = await asyncio.to_thread(image_path.is_file)
             if not is_file:
                 _LOGGER.error("Image path is not a file: %s", image_path)
                 return None
@@ -128,108 +270,148 @@ class BloominPresenceCoordinator:
     
     async def get_latest_image(self) -> Path | None:
         """Get a random image from the media folder."""
-        import random
-        
         folder_path = self.get_media_folder_path()
         _LOGGER.debug("Looking for images in folder: %s", folder_path)
         
-        # Check existence in thread pool to avoid blocking
-        exists = await asyncio.to_thread(folder_path.exists)
-        if not exists:
+        # Create the folder on first use only; a folder removed later is reported below
+        if not self._media_folder_ready:
+            await asyncio.to_thread(self._create_media_folder, folder_path)
+            self._media_folder_ready = True
+        
+        # One stat answers exists / is-dir and tells whether the cached listing is stale
+        try:
+            folder_stat = await asyncio.to_thread(folder_path.stat)
+        except FileNotFoundError:
             _LOGGER.warning("Media folder does not exist: %s", folder_path)
             return None
+        except OSError as e:
+            _LOGGER.error("Error reading media folder: %s - %s", folder_path, e)
+            return None
         
-        is_dir = await asyncio.to_thread(folder_path.is_dir)
-        if not is_dir:
+        if not stat.S_ISDIR(folder_stat.st_mode):
             _LOGGER.error("Media folder path is not a directory: %s", folder_path)
             return None
         
         # Find all image files in thread pool to avoid blocking
-        image_extensions = {".jpg", ".jpeg", ".png", ".bmp"}
-        try:
-            def _list_images():
-                return [
-                    f for f in folder_path.iterdir()
-                    if f.is_file() and f.suffix.lower() in image_extensions
-                ]
-            
-            image_files = await asyncio.to_thread(_list_images)
-        except PermissionError as e:
-            _LOGGER.error("Permission denied accessing media folder: %s - %s", folder_path, e)
-            return None
-        except Exception as e:
-            _LOGGER.error("Error reading media folder: %s - %s", folder_path, e)
-            return None
+        cache = self._image_list_cache
+        if cache is not None and cache[0] == folder_path and cache[1] == folder_stat.st_mtime_ns:
+            # Adding, removing or renaming files updates the folder mtime
+            image_files = cache[2]
+        else:
+            try:
+                def _list_images():
+                    # DirEntry.is_file() answers from the directory listing itself;
+                    # the cheap suffix check runs first so only candidates are tested
+                    # (plain strings; only the picked image becomes a Path)
+                    with os.scandir(folder_path) as entries:
+                        return [
+                            entry.path for entry in entries
+                            if entry.name.rpartition(".")[2].lower() in _IMAGE_EXTENSIONS
+                            and entry.is_file()
+                        ]
+                
+                image_files = await asyncio.to_thread(_list_images)
+            except PermissionError as e:
+                _LOGGER.error("Permission denied accessing media folder: %s - %s", folder_path, e)
+                return None
+            except Exception as e:
+                _LOGGER.error("Error reading media folder: %s - %s", folder_path, e)
+                return None
+            self._image_list_cache = (folder_path, folder_stat.st_mtime_ns, image_files)
         
         if not image_files:
             _LOGGER.warning("No images found in media folder: %s (supported formats: %s)", 
-                          folder_path, ", ".join(image_extensions))
+                          folder_path, ", ".join(sorted(_IMAGE_EXTENSIONS)))
             return None
         
         # Return a random image from the folder
-        selected_image = random.choice(image_files)
+        selected_image = Path(self._random.choice(image_files))
         _LOGGER.info("Selected random image: %s from %d total images in folder: %s", 
                     selected_image.name, len(image_files), folder_path)
         return selected_image
 
+    @callback
+    def _async_registry_updated(self, event: Event) -> None:
+        """Forget the cached BLOOMIN entity when a media_player registry entry changes."""
+        if any(
+            entity_id.startswith(_MEDIA_PLAYER_PREFIX)
+            for entity_id in (event.data.get("entity_id", ""), event.data.get("old_entity_id", ""))
+        ):
+            self._bloomin_entity = None
+
     def _find_bloomin_entity(self) -> str | None:
+        """Return the BLOOMIN media_player entity, looking it up only when needed.
+        
+        The result is cached until the entity registry changes. A failed
+        lookup is not cached, so the entity is found once
+        bloomin8_eink_canvas finishes loading.
+        """
+        if self._bloomin_entity is None:
+            self._bloomin_entity = self._lookup_bloomin_entity()
+        return self._bloomin_entity
+
+    def _lookup_bloomin_entity(self) -> str | None:
         """Find the BLOOMIN media_player entity matching our IP.
         
         Strategy:
         1. First, try to find config_entry with matching IP from bloomin8_eink_canvas domain
         2. Then find media_player entities linked to that config_entry
-        3. Fallback to searching all media_player entities by platform/IP
+        3. Fallback to media_player entities of other platforms by name/IP
         """
         entity_registry = er.async_get(self.hass)
         _LOGGER.debug("Searching for BLOOMIN entity with IP: %s", self.bloomin_ip)
         
         # Method 1: Find config_entry by domain and IP, then find its entities
+        # (each config entry's IP is checked once here, not once per entity)
+        checked_entry_ids: set[str] = set()
+        all_bloomin_entities: list[str] = []
         try:
-            for entry_id, config_entry in self.hass.config_entries.async_entries("bloomin8_eink_canvas"):
+            for config_entry in self.hass.config_entries.async_entries("bloomin8_eink_canvas"):
+                entry_id = config_entry.entry_id
+                checked_entry_ids.add(entry_id)
                 entry_ip = config_entry.data.get("host") or config_entry.data.get("ip_address")
                 _LOGGER.debug("Found bloomin8_eink_canvas config_entry: %s (IP: %s)", entry_id, entry_ip)
                 
-                if entry_ip == self.bloomin_ip:
-                    # Find media_player entities linked to this config_entry
-                    matching_entities = [
-                        entity_id
-                        for entity_id, entity in entity_registry.entities.items()
-                        if (entity_id.startswith("media_player.") and
-                            hasattr(entity, "config_entry_id") and
-                            entity.config_entry_id == entry_id)
-                    ]
-                    
-                    if matching_entities:
-                        _LOGGER.info(
-                            "Found %d matching BLOOMIN entity(ies) via config_entry: %s",
-                            len(matching_entities), matching_entities
-                        )
-                        return matching_entities[0]
+                # Find media_player entities linked to this config_entry
+                # (the registry indexes entries by config entry, no full scan;
+                # registered players without a state yet are included)
+                entry_entities = [
+                    entity.entity_id
+                    for entity in er.async_entries_for_config_entry(entity_registry, entry_id)
+                    if entity.entity_id.startswith(_MEDIA_PLAYER_PREFIX)
+                ]
+                all_bloomin_entities.extend(entry_entities)
+                
+                if entry_ip == self.bloomin_ip and entry_entities:
+                    _LOGGER.info(
+                        "Found %d matching BLOOMIN entity(ies) via config_entry: %s",
+                        len(entry_entities), entry_entities
+                    )
+                    return entry_entities[0]
         except Exception as e:
             _LOGGER.debug("Error finding via config_entry: %s", e)
         
-        # Method 2: Fallback - search all media_player entities
+        # Method 2: Fallback - media players from other platforms that look like a
+        # BLOOMIN display. The state machine indexes entity IDs by domain, so only
+        # media players are visited; bloomin8_eink_canvas entities, with or
+        # without a state, were already collected through their config entries
         matching_entities = []
-        all_bloomin_entities = []
-        
-        for entity_id, entity in entity_registry.entities.items():
-            # Check if it's a media_player entity
-            if not entity_id.startswith("media_player."):
+        seen_entities = set(all_bloomin_entities)
+        for entity_id in self.hass.states.async_entity_ids("media_player"):
+            if entity_id in seen_entities or not _BLOOMIN_NAME_RE.search(entity_id.lower()):
                 continue
-                
-            # Check if it's from bloomin8_eink_canvas platform
-            if entity.platform == "bloomin8_eink_canvas" or "bloomin" in entity_id.lower() or "eink" in entity_id.lower():
-                all_bloomin_entities.append(entity_id)
-                
-                # Check if this entity matches our IP
-                if hasattr(entity, "config_entry_id") and entity.config_entry_id:
-                    config_entry = self.hass.config_entries.async_get_entry(entity.config_entry_id)
-                    if config_entry:
-                        entity_ip = config_entry.data.get("host") or config_entry.data.get("ip_address")
-                        _LOGGER.debug("Found potential entity: %s (IP: %s, platform: %s)", entity_id, entity_ip, entity.platform)
-                        if entity_ip == self.bloomin_ip:
-                            matching_entities.append(entity_id)
-                            _LOGGER.debug("Entity IP matches: %s", entity_id)
+            all_bloomin_entities.append(entity_id)
+            
+            # Check if this entity matches our IP (entries seen in Method 1 already failed that)
+            entity = entity_registry.async_get(entity_id)
+            if entity and entity.config_entry_id and entity.config_entry_id not in checked_entry_ids:
+                config_entry = self.hass.config_entries.async_get_entry(entity.config_entry_id)
+                if config_entry:
+                    entity_ip = config_entry.data.get("host") or config_entry.data.get("ip_address")
+                    _LOGGER.debug("Found potential entity: %s (IP: %s, platform: %s)", entity_id, entity_ip, entity.platform)
+                    if entity_ip == self.bloomin_ip:
+                        matching_entities.append(entity_id)
+                        _LOGGER.debug("Entity IP matches: %s", entity_id)
         
         if matching_entities:
             _LOGGER.info("Found %d matching BLOOMIN entity(ies): %s", len(matching_entities), matching_entities)
@@ -267,9 +449,11 @@ class BloominPresenceCoordinator:
             )
             try:
                 success = await wake_device_via_ble(
+                    self.hass,
                     self.ble_mac_address,
                     self.ble_service_uuid,
-                    self.ble_characteristic_uuid
+                    self.ble_characteristic_uuid,
+                    session=self.ble_session,
                 )
                 if success:
                     _LOGGER.info("Successfully woke up BLOOMIN device via BLE")
@@ -285,26 +469,23 @@ class BloominPresenceCoordinator:
         bloomin_entity = self._find_bloomin_entity()
         
         if bloomin_entity:
-            # Check if the service exists
-            if "eink_display" in self.hass.services.async_services():
-                if "whistle" in self.hass.services.async_services().get("eink_display", {}):
-                    try:
-                        _LOGGER.debug("Attempting to wake device via eink_display.whistle service (fallback)")
-                        await self.hass.services.async_call(
-                            "eink_display",
-                            "whistle",
-                            {"entity_id": bloomin_entity},
-                        )
-                        _LOGGER.info("Successfully woke up BLOOMIN device using eink_display.whistle service")
-                        return
-                    except (ValueError, AttributeError, KeyError) as e:
-                        _LOGGER.debug("Could not use eink_display.whistle service: %s", e)
-                    except Exception as e:
-                        _LOGGER.debug("Unexpected error using eink_display.whistle service: %s", e)
-                else:
-                    _LOGGER.debug("eink_display.whistle service not available")
+            # Check if the service exists (has_service looks it up without copying the registry)
+            if self.hass.services.has_service("eink_display", "whistle"):
+                try:
+                    _LOGGER.debug("Attempting to wake device via eink_display.whistle service (fallback)")
+                    await self.hass.services.async_call(
+                        "eink_display",
+                        "whistle",
+                        {"entity_id": bloomin_entity},
+                    )
+                    _LOGGER.info("Successfully woke up BLOOMIN device using eink_display.whistle service")
+                    return
+                except (ValueError, AttributeError, KeyError) as e:
+                    _LOGGER.debug("Could not use eink_display.whistle service: %s", e)
+                except Exception as e:
+                    _LOGGER.debug("Unexpected error using eink_display.whistle service: %s", e)
             else:
-                _LOGGER.debug("eink_display domain not available")
+                _LOGGER.debug("eink_display.whistle service not available")
         
         # Priority 3: Try HTTP API wake endpoint (WiFi-based fallback)
         try:
@@ -314,18 +495,121 @@ class BloominPresenceCoordinator:
                 _LOGGER.info("Successfully woke up BLOOMIN device via HTTP API")
             else:
                 _LOGGER.warning("All wake methods failed. Device may need to be woken manually.")
-        except (asyncio.TimeoutError, Exception) as e:
+        except Exception as e:
             _LOGGER.warning("HTTP API wake error: %s", e)
 
-    async def process_and_upload_image(self, image_path: Path | None = None) -> bool:
-        """Process image with presence overlay and upload to BLOOMIN device."""
+    def _translations_task_for(self, language: str) -> asyncio.Task[dict[str, str]]:
+        """Return the translation fetch for language, starting it if needed.
+        
+        The fetch starts when the coordinator is created, so by the first
+        upload it has usually finished and awaiting it returns immediately.
+        """
+        if self._translations_task is None or self._translations_language != language:
+            self._translations_language = language
+            self._translations_task = self.hass.async_create_task(
+                translation.async_get_translations(
+                    self.hass,
+                    language,
+                    "config",
+                    [DOMAIN]
+                )
+            )
+        return self._translations_task
+
+    async def _async_get_overlay_config(self) -> tuple[dict[str, Any], int]:
+        """Return (overlay config, image quality), rebuilt only when they can have changed.
+        
+        Options and data are replaced, not mutated, when the entry is updated,
+        so holding references to them tells whether the cached config is stale.
+        Translations are resolved once per language.
+        """
+        language = self.hass.config.language
+        cache = self._overlay_config_cache
+        if (
+            cache is not None
+            and cache[0] is self.entry.options
+            and cache[1] is self.entry.data
+            and cache[2] == language
+        ):
+            return cache[3], cache[4]
+        
+        # Check both options and data for overlay settings (options takes precedence)
+        overlay_position = self.entry.options.get(
+            "overlay_position",
+            self.entry.data.get("overlay_position", "bottom_right")
+        )
+        overlay_style = self.entry.options.get(
+            "overlay_style",
+            self.entry.data.get("overlay_style", "badge")
+        )
+        image_quality = self.entry.options.get(
+            CONF_IMAGE_QUALITY,
+            self.entry.data.get(CONF_IMAGE_QUALITY, DEFAULT_IMAGE_QUALITY)
+        )
+        badge_size = self.entry.options.get(
+            CONF_OVERLAY_BADGE_SIZE,
+            self.entry.data.get(CONF_OVERLAY_BADGE_SIZE, DEFAULT_OVERLAY_BADGE_SIZE)
+        )
+        icon_size = self.entry.options.get(
+            CONF_OVERLAY_ICON_SIZE,
+            self.entry.data.get(CONF_OVERLAY_ICON_SIZE, DEFAULT_OVERLAY_ICON_SIZE)
+        )
+        font_size = self.entry.options.get(
+            CONF_OVERLAY_FONT_SIZE,
+            self.entry.data.get(CONF_OVERLAY_FONT_SIZE, DEFAULT_OVERLAY_FONT_SIZE)
+        )
+        margin = self.entry.options.get(
+            CONF_OVERLAY_MARGIN,
+            self.entry.data.get(CONF_OVERLAY_MARGIN, DEFAULT_OVERLAY_MARGIN)
+        )
+        
+        # Get text translations
+        translated = True
+        try:
+            translations = await self._translations_task_for(language)
+            home_text = translations.get(f"component.{DOMAIN}.overlay.home", "집에 있음")
+            away_text = translations.get(f"component.{DOMAIN}.overlay.away", "외출 중")
+        except Exception:
+            # Fallback to default Korean text; fetch again next time
+            self._translations_task = None
+            translated = False
+            home_text = "집에 있음"
+            away_text = "외출 중"
+        
+        overlay_config = {
+            "position": overlay_position,
+            "style": overlay_style,
+            "badge_size": badge_size,
+            "icon_size": icon_size,
+            "font_size": font_size,
+            "margin": margin,
+            "home_text": home_text,
+            "away_text": away_text,
+        }
+        _LOGGER.debug(
+            "Overlay config: position=%s, style=%s, quality=%d, badge=%d, icon=%d, font=%d, margin=%d",
+            overlay_position, overlay_style, image_quality, badge_size, icon_size, font_size, margin
+        )
+        
+        # Not cached with the fallback texts, so the next call retries the translations
+        if translated:
+            self._overlay_config_cache = (
+                self.entry.options, self.entry.data, language, overlay_config, image_quality
+            )
+        return overlay_config, image_quality
+
+    async def process_and_upload_image(
+        self, image_path: Path | None = None, wake: bool = True
+    ) -> bool:
+        """Process image with presence overlay and upload to BLOOMIN device.
+        
+        Args:
+            image_path: Image to upload (if None, uses the configured source)
+            wake: Wake the device first (False if the caller already woke it)
+        """
         _LOGGER.info("Starting image processing and upload (entry_id: %s)", self.entry.entry_id)
         
         try:
-            # Wake up BLOOMIN device first (BLE-based device needs to be woken up)
-            _LOGGER.debug("Waking up BLOOMIN device...")
-            await self.wake_device()
-            
             # Get current person states (support multiple persons)
             _LOGGER.debug("Getting person entity states: %s", self.person_entities)
             
@@ -337,18 +621,24 @@ class BloominPresenceCoordinator:
             is_home = False
             person_states = []
             
+            # One snapshot of all person states instead of a lookup per entity
+            current_states = {
+                state.entity_id: state.state
+                for state in self.hass.states.async_all("person")
+            }
             for person_entity_id in self.person_entities:
-                person_state = self.hass.states.get(person_entity_id)
-                if person_state is None:
+                current_state = current_states.get(person_entity_id)
+                if current_state is None:
                     _LOGGER.warning("Person entity %s not found", person_entity_id)
                     continue
                 
-                current_state = person_state.state
                 person_is_home = current_state == PERSON_STATE_HOME
                 person_states.append((person_entity_id, current_state, person_is_home))
                 
                 if person_is_home:
+                    # The overlay only shows whether anyone is home
                     is_home = True
+                    break
             
             if not person_states:
                 _LOGGER.error("No valid person entities found")
@@ -360,6 +650,18 @@ class BloominPresenceCoordinator:
                 is_home
             )
             
+            # Wake up BLOOMIN device first (BLE-based device needs to be woken up),
+            # unless it was updated moments ago and is most likely still awake
+            wake_skipped = False
+            if wake:
+                since_upload = time.monotonic() - self._last_successful_upload
+                if since_upload < WAKE_CACHE_SECONDS:
+                    _LOGGER.debug("Display was updated %.0fs ago, skipping wake", since_upload)
+                    wake_skipped = True
+                else:
+                    _LOGGER.debug("Waking up BLOOMIN device...")
+                    await self.wake_device()
+            
             # Get image path if not provided
             if image_path is None:
                 _LOGGER.debug("Image path not provided, getting from configured source")
@@ -371,85 +673,11 @@ class BloominPresenceCoordinator:
                 _LOGGER.error("Failed to get image path")
                 return False
             
-            # Check existence in thread pool to avoid blocking
-            exists = await asyncio.to_thread(image_path.exists)
-            if not exists:
-                _LOGGER.error("Image file does not exist: %s", image_path)
-                return False
-            
+            # A missing file surfaces as FileNotFoundError from the render job below
             _LOGGER.info("Processing image: %s", image_path)
             
             # Process image with presence overlay
-            # Check both options and data for overlay settings (options takes precedence)
-            overlay_position = self.entry.options.get(
-                "overlay_position",
-                self.entry.data.get("overlay_position", "bottom_right")
-            )
-            overlay_style = self.entry.options.get(
-                "overlay_style",
-                self.entry.data.get("overlay_style", "badge")
-            )
-            image_quality = self.entry.options.get(
-                CONF_IMAGE_QUALITY,
-                self.entry.data.get(CONF_IMAGE_QUALITY, DEFAULT_IMAGE_QUALITY)
-            )
-            badge_size = self.entry.options.get(
-                CONF_OVERLAY_BADGE_SIZE,
-                self.entry.data.get(CONF_OVERLAY_BADGE_SIZE, DEFAULT_OVERLAY_BADGE_SIZE)
-            )
-            icon_size = self.entry.options.get(
-                CONF_OVERLAY_ICON_SIZE,
-                self.entry.data.get(CONF_OVERLAY_ICON_SIZE, DEFAULT_OVERLAY_ICON_SIZE)
-            )
-            font_size = self.entry.options.get(
-                CONF_OVERLAY_FONT_SIZE,
-                self.entry.data.get(CONF_OVERLAY_FONT_SIZE, DEFAULT_OVERLAY_FONT_SIZE)
-            )
-            margin = self.entry.options.get(
-                CONF_OVERLAY_MARGIN,
-                self.entry.data.get(CONF_OVERLAY_MARGIN, DEFAULT_OVERLAY_MARGIN)
-            )
-            
-            # Get text translations
-            try:
-                from homeassistant.helpers import translation
-                translations = await translation.async_get_translations(
-                    self.hass,
-                    self.hass.config.language,
-                    "config",
-                    [DOMAIN]
-                )
-                home_text = translations.get(f"component.{DOMAIN}.overlay.home", "집에 있음")
-                away_text = translations.get(f"component.{DOMAIN}.overlay.away", "외출 중")
-            except Exception:
-                # Fallback to default Korean text
-                home_text = "집에 있음"
-                away_text = "외출 중"
-            
-            overlay_config = {
-                "position": overlay_position,
-                "style": overlay_style,
-                "badge_size": badge_size,
-                "icon_size": icon_size,
-                "font_size": font_size,
-                "margin": margin,
-                "home_text": home_text,
-                "away_text": away_text,
-            }
-            _LOGGER.debug(
-                "Overlay config: position=%s, style=%s, quality=%d, badge=%d, icon=%d, font=%d, margin=%d",
-                overlay_position, overlay_style, image_quality, badge_size, icon_size, font_size, margin
-            )
-            
-            _LOGGER.debug("Processing image with overlay (this may take a moment)...")
-            processed_image = await self.hass.async_add_executor_job(
-                self.image_processor.add_presence_overlay,
-                str(image_path),
-                is_home,
-                overlay_config,
-                image_quality
-            )
-            _LOGGER.debug("Image processed successfully, size: %d bytes", len(processed_image))
+            overlay_config, image_quality = await self._async_get_overlay_config()
             
             # Upload to BLOOMIN device using media_player.play_media service
             # This uses the official bloomin8_eink_canvas integration's built-in functionality
@@ -462,46 +690,81 @@ class BloominPresenceCoordinator:
                 _LOGGER.error("BLOOMIN media_player entity not found. Make sure bloomin8_eink_canvas integration is configured.")
                 _LOGGER.debug("Available media_player entities: %s", [
                     entity_id for entity_id in er.async_get(self.hass).entities.keys()
-                    if "bloomin" in entity_id.lower() or "eink" in entity_id.lower()
+                    if _BLOOMIN_NAME_RE.search(entity_id.lower())
                 ])
                 return False
             
             # Save processed image to media directory
-            import time
-            # Get the actual media directory path
-            media_dirs = self.hass.config.media_dirs
-            local_media_dir = media_dirs.get("local")
-            if not local_media_dir:
-                # Fallback to default media directory
-                local_media_dir = self.hass.config.path("media")
-            
-            output_dir = Path(local_media_dir) / "bloomin_presence"
-            # Create directory in thread pool to avoid blocking
-            await asyncio.to_thread(output_dir.mkdir, parents=True, exist_ok=True)
+            local_media_dir = self._local_media_dir
+            output_dir = local_media_dir / "bloomin_presence"
+            # Create directory in thread pool to avoid blocking (once; see _save_and_prune)
+            if not self._output_dir_ready:
+                await asyncio.to_thread(output_dir.mkdir, parents=True, exist_ok=True)
+                self._output_dir_ready = True
             
             timestamp = int(time.time() * 1000)
-            image_filename = f"presence_{self.entry.entry_id}_{timestamp}.jpg"
+            image_prefix = f"presence_{self.entry.entry_id}_"
+            image_filename = f"{image_prefix}{timestamp}.jpg"
             output_path = output_dir / image_filename
             
             try:
-                # Write file in thread pool to avoid blocking
-                def _write_file():
-                    with open(output_path, "wb") as f:
-                        f.write(processed_image)
+                # Render and encode straight into the output file in the executor,
+                # then drop old frames in the same job so the folder stays small
+                def _save() -> int:
+                    return self.image_processor.save_presence_overlay(
+                        str(image_path),
+                        is_home,
+                        overlay_config,
+                        str(output_path),
+                        image_quality
+                    )
                 
-                await asyncio.to_thread(_write_file)
-                _LOGGER.debug("Saved processed image to: %s", output_path)
+                last_render = self._last_render
                 
-                # Verify file was written
-                file_exists = await asyncio.to_thread(output_path.exists)
-                if not file_exists:
-                    _LOGGER.error("File was not created: %s", output_path)
-                    return False
+                def _save_and_prune() -> tuple[int, tuple[Any, ...]]:
+                    render_key = (
+                        str(image_path),
+                        os.stat(str(image_path)).st_mtime_ns,
+                        is_home,
+                        overlay_config,
+                        image_quality,
+                    )
+                    size = None
+                    if last_render is not None and last_render[0] == render_key:
+                        # Same source file, presence and settings as the previous render:
+                        # copy its output instead of decoding and encoding again
+                        try:
+                            size = _copy_file_atomic(last_render[1], str(output_path))
+                            _LOGGER.debug("Inputs unchanged, reused render %s", last_render[1])
+                        except OSError:
+                            # Previous output is gone; render again
+                            size = None
+                    if size is None:
+                        try:
+                            size = _save()
+                        except FileNotFoundError:
+                            if output_dir.is_dir():
+                                raise
+                            # The output folder was removed after it was created; recreate it once
+                            output_dir.mkdir(parents=True, exist_ok=True)
+                            size = _save()
+                    try:
+                        _prune_output_images(output_dir, image_prefix, OUTPUT_IMAGES_TO_KEEP)
+                    except OSError as e:
+                        _LOGGER.warning("Failed to prune old images in %s: %s", output_dir, e)
+                    return size, render_key
+                
+                _LOGGER.debug("Processing image with overlay (this may take a moment)...")
+                image_size, render_key = await self.hass.loop.run_in_executor(
+                    self._image_executor, _save_and_prune
+                )
+                self._last_render = (render_key, output_path)
+                _LOGGER.debug("Saved processed image to: %s (%d bytes)", output_path, image_size)
                 
                 # Get relative path from media directory for media_content_id
                 # The path should be relative to the media directory root
                 try:
-                    relative_path = output_path.relative_to(Path(local_media_dir))
+                    relative_path = output_path.relative_to(local_media_dir)
                     _LOGGER.debug("Relative path from media dir: %s", relative_path)
                 except ValueError:
                     # If relative path calculation fails, use filename only
@@ -518,38 +781,55 @@ class BloominPresenceCoordinator:
                     f"media://local/bloomin_presence/{image_filename}",
                 ]
                 
-                # Also try the media browser format: directory,device_galleries/directory,gallery:default/filename
-                # But first try standard formats
-                for media_content_id in media_content_id_variants:
-                    try:
-                        _LOGGER.info(
-                            "Calling media_player.play_media service for entity: %s with media_content_id: %s",
-                            bloomin_entity, media_content_id
-                        )
-                        
-                        result = await self.hass.services.async_call(
-                            "media_player",
-                            "play_media",
-                            {
-                                "entity_id": bloomin_entity,
-                                "media_content_id": media_content_id,
-                                "media_content_type": "image/jpeg",
-                            },
-                            blocking=True,  # Wait for result
-                        )
-                        
-                        _LOGGER.info(
-                            "Successfully uploaded and displayed image on BLOOMIN display via media_player service (presence: %s, path: %s)",
-                            "Home" if is_home else "Away",
-                            media_content_id
-                        )
-                        return True
-                    except (ValueError, AttributeError, KeyError) as e:
-                        _LOGGER.debug("Failed with media_content_id '%s': %s, trying next format", media_content_id, e)
-                        continue
-                    except Exception as e:
-                        _LOGGER.debug("Error with media_content_id '%s': %s, trying next format", media_content_id, e)
-                        continue
+                # Start with the format that worked last time; the others are only
+                # tried if it stops working (e.g. after a bloomin8_eink_canvas update)
+                variant_order = list(range(len(media_content_id_variants)))
+                if self._media_content_id_format is not None:
+                    variant_order.remove(self._media_content_id_format)
+                    variant_order.insert(0, self._media_content_id_format)
+                
+                # If the wake was skipped and the display does not take the image,
+                # it may have gone back to sleep: wake it and try once more
+                for attempt in range(2 if wake_skipped else 1):
+                    if attempt:
+                        _LOGGER.debug("Upload failed without a wake, waking BLOOMIN device and retrying")
+                        await self.wake_device()
+                    
+                    # Also try the media browser format: directory,device_galleries/directory,gallery:default/filename
+                    # But first try standard formats
+                    for variant_index in variant_order:
+                        media_content_id = media_content_id_variants[variant_index]
+                        try:
+                            _LOGGER.info(
+                                "Calling media_player.play_media service for entity: %s with media_content_id: %s",
+                                bloomin_entity, media_content_id
+                            )
+                            
+                            result = await self.hass.services.async_call(
+                                "media_player",
+                                "play_media",
+                                {
+                                    "entity_id": bloomin_entity,
+                                    "media_content_id": media_content_id,
+                                    "media_content_type": "image/jpeg",
+                                },
+                                blocking=True,  # Wait for result
+                            )
+                            
+                            self._media_content_id_format = variant_index
+                            self._last_successful_upload = time.monotonic()
+                            _LOGGER.info(
+                                "Successfully uploaded and displayed image on BLOOMIN display via media_player service (presence: %s, path: %s)",
+                                "Home" if is_home else "Away",
+                                media_content_id
+                            )
+                            return True
+                        except (ValueError, AttributeError, KeyError) as e:
+                            _LOGGER.debug("Failed with media_content_id '%s': %s, trying next format", media_content_id, e)
+                            continue
+                        except Exception as e:
+                            _LOGGER.debug("Error with media_content_id '%s': %s, trying next format", media_content_id, e)
+                            continue
                 
                 # If all standard formats failed, log error
                 _LOGGER.error(
@@ -559,14 +839,20 @@ class BloominPresenceCoordinator:
                 )
                 return False
                 
-            except (IOError, OSError) as e:
+            except FileNotFoundError as e:
+                if e.filename == str(image_path):
+                    _LOGGER.error("Image file does not exist: %s", image_path)
+                else:
+                    _LOGGER.error("Failed to save processed image: %s", e, exc_info=True)
+                return False
+            except OSError as e:
                 _LOGGER.error("Failed to save processed image: %s", e, exc_info=True)
                 return False
             except Exception as e:
                 _LOGGER.error("Unexpected error: %s", e, exc_info=True)
                 return False
                 
-        except (IOError, OSError) as err:
+        except OSError as err:
             _LOGGER.error("File I/O error processing and uploading image: %s", err, exc_info=True)
             return False
         except Exception as err:
@@ -0,0 +1,49 @@
+"""Selectors shared by the config and options flows."""
+from __future__ import annotations
+
+from homeassistant.helpers import selector
+
+from .const import (
+    IMAGE_SOURCE_FILE,
+    IMAGE_SOURCE_FOLDER,
+    OVERLAY_POSITION_BOTTOM_LEFT,
+    OVERLAY_POSITION_BOTTOM_RIGHT,
+    OVERLAY_POSITION_TOP_LEFT,
+    OVERLAY_POSITION_TOP_RIGHT,
+    OVERLAY_STYLE_BADGE,
+    OVERLAY_STYLE_ICON,
+    OVERLAY_STYLE_TEXT,
+)
+
+IMAGE_SOURCE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            IMAGE_SOURCE_FOLDER,
+            IMAGE_SOURCE_FILE,
+        ],
+        translation_key="image_source",
+    )
+)
+
+OVERLAY_POSITION_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            OVERLAY_POSITION_BOTTOM_RIGHT,
+            OVERLAY_POSITION_BOTTOM_LEFT,
+            OVERLAY_POSITION_TOP_RIGHT,
+            OVERLAY_POSITION_TOP_LEFT,
+        ],
+        translation_key="overlay_position",
+    )
+)
+
+OVERLAY_STYLE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            OVERLAY_STYLE_BADGE,
+            OVERLAY_STYLE_TEXT,
+            OVERLAY_STYLE_ICON,
+        ],
+        translation_key="overlay_style",
+    )
+)
@@ -1,8 +1,9 @@
 """Image processing utilities for presence overlay."""
 from __future__ import annotations
 
-import io
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -14,66 +15,145 @@ from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fonts tried for the text overlay, in order of preference
+_FONT_CANDIDATES = (
+    "/System/Library/Fonts/Helvetica.ttc",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+)
+# First candidate present on this system (None = use PIL's default font)
+_RESOLVED_FONT_PATH: str | None = next(
+    (path for path in _FONT_CANDIDATES if os.path.exists(path)), None
+)
+
+# Single-pass baseline JPEG with 4:2:0 chroma subsampling: no extra
+# entropy-optimisation or progressive scans, and a smaller file to upload
+_JPEG_SAVE_OPTIONS: dict[str, Any] = {
+    "optimize": False,
+    "progressive": False,
+    "subsampling": 2,
+}
+
+
+@lru_cache(maxsize=64)
+def _calculate_position(
+    width: int, height: int, position: str, badge_size: int, margin: int
+) -> tuple[int, int]:
+    """Calculate overlay position."""
+    if position == "bottom_right":
+        return (width - badge_size - margin, height - badge_size - margin)
+    elif position == "bottom_left":
+        return (margin, height - badge_size - margin)
+    elif position == "top_right":
+        return (width - badge_size - margin, margin)
+    elif position == "top_left":
+        return (margin, margin)
+    else:
+        # Default to bottom_right
+        return (width - badge_size - margin, height - badge_size - margin)
+
 
 class ImageProcessor:
     """Handle image processing with presence overlay."""
 
     def __init__(self, hass: HomeAssistant | None = None) -> None:
         """Initialize the image processor."""
-        self._font_cache = {}
+        self._font_cache: dict[tuple[str, int], ImageFont.ImageFont | ImageFont.FreeTypeFont] = {}
+        # Pre-rendered badge/icon sprites keyed by (style, is_home, size); never mutated
+        self._sprite_cache: dict[tuple[str, bool, int], Image.Image] = {}
         self.hass = hass
 
-    def add_presence_overlay(
+    def _get_font(self, font_size: int) -> ImageFont.ImageFont | ImageFont.FreeTypeFont:
+        """Return the overlay font at font_size, parsing the font file only once."""
+        key = (_RESOLVED_FONT_PATH or "", font_size)
+        font = self._font_cache.get(key)
+        if font is None:
+            if _RESOLVED_FONT_PATH:
+                font = ImageFont.truetype(_RESOLVED_FONT_PATH, font_size)
+            else:
+                font = ImageFont.load_default()
+            self._font_cache[key] = font
+        return font
+
+    def save_presence_overlay(
         self,
         image_path: str,
         is_home: bool,
         overlay_config: dict[str, Any],
+        output_path: str,
         image_quality: int = 95,
-    ) -> bytes:
-        """Add presence overlay to image and return as bytes."""
+    ) -> int:
+        """Add presence overlay to image and write it as JPEG to output_path.
+        
+        Encodes straight into the file, so the JPEG never exists as a bytes
+        object in memory. The JPEG is written to a temporary file and moved
+        into place, so readers never see a partially written image. Returns
+        the size of the written file.
+        """
+        tmp_path = f"{output_path}.tmp"
         try:
-            # Load image
-            image = Image.open(image_path)
-            image = image.convert("RGB")  # Ensure RGB mode
-            
-            # Create overlay
-            overlay = self._create_overlay(
-                image.size,
-                is_home,
-                overlay_config
-            )
-            
-            # Composite overlay onto image
-            if overlay.mode == "RGBA":
-                # Convert image to RGBA for alpha compositing
-                image_rgba = image.convert("RGBA")
-                # Composite overlay onto image
-                image = Image.alpha_composite(image_rgba, overlay).convert("RGB")
-            else:
-                # Paste overlay if it's not RGBA
-                image.paste(overlay, (0, 0), overlay if overlay.mode == "RGBA" else None)
-            
-            # Convert to bytes
-            output = io.BytesIO()
-            image.save(output, format="JPEG", quality=image_quality)
-            output.seek(0)
-            
-            return output.getvalue()
+            image = self._compose_presence_overlay(image_path, is_home, overlay_config)
+            try:
+                image.save(tmp_path, format="JPEG", quality=image_quality, **_JPEG_SAVE_OPTIONS)
+                size = os.stat(tmp_path).st_size
+                os.replace(tmp_path, output_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except FileNotFoundError:
+                    pass
+                raise
+            return size
             
-        except (IOError, OSError) as e:
+        except OSError as e:
             _LOGGER.error("File I/O error processing image: %s", e)
             raise
         except Exception as e:
             _LOGGER.error("Unexpected error processing image: %s", e, exc_info=True)
             raise
 
+    def _compose_presence_overlay(
+        self,
+        image_path: str,
+        is_home: bool,
+        overlay_config: dict[str, Any],
+    ) -> Image.Image:
+        """Load the image and composite the presence overlay onto it."""
+        # Load image
+        image = Image.open(image_path)
+        if image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info:
+            # Drop source transparency so the overlay lands on an opaque image
+            image = image.convert("RGB")
+        # Convert straight to RGBA for alpha compositing (one pass for RGB sources)
+        image_rgba = image.convert("RGBA")
+        
+        # Create overlay (a small sprite and where its top-left corner goes)
+        overlay, (x, y) = self._create_overlay(
+            image_rgba.size,
+            is_home,
+            overlay_config
+        )
+        
+        # Composite overlay onto image in place; only the sprite's area is blended.
+        # A sprite starting left of / above the image edge has that part cut off.
+        image_rgba.alpha_composite(
+            overlay,
+            dest=(max(x, 0), max(y, 0)),
+            source=(max(-x, 0), max(-y, 0)),
+        )
+        # The only conversion back to RGB (for JPEG)
+        return image_rgba.convert("RGB")
+
     def _create_overlay(
         self,
         image_size: tuple[int, int],
         is_home: bool,
         config: dict[str, Any],
-    ) -> Image.Image:
-        """Create presence overlay image."""
+    ) -> tuple[Image.Image, tuple[int, int]]:
+        """Create presence overlay sprite and the image position of its top-left corner.
+        
+        The sprite only covers what is drawn, not the whole image, so it is
+        cheap to allocate and to composite.
+        """
         width, height = image_size
         position = config.get("position", "bottom_right")
         style = config.get("style", "badge")
@@ -82,41 +162,37 @@ class ImageProcessor:
         font_size = config.get("font_size", 16)
         margin = config.get("margin", 15)
         
-        # Create transparent overlay
-        overlay = Image.new("RGBA", (width, height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(overlay)
-        
         # Calculate position
-        x, y = self._calculate_position(width, height, position, badge_size, margin)
+        x, y = _calculate_position(width, height, position, badge_size, margin)
         
         # Draw overlay based on style
         home_text = config.get("home_text", "집에 있음")
         away_text = config.get("away_text", "외출 중")
         
         if style == "badge":
-            self._draw_badge(draw, x, y, is_home, badge_size)
-        elif style == "text":
-            self._draw_text(draw, x, y, is_home, width, height, font_size, margin, home_text, away_text)
-        elif style == "icon":
-            self._draw_icon(draw, x, y, is_home, icon_size)
-        
-        return overlay
-
-    def _calculate_position(
-        self, width: int, height: int, position: str, badge_size: int, margin: int
-    ) -> tuple[int, int]:
-        """Calculate overlay position."""
-        if position == "bottom_right":
-            return (width - badge_size - margin, height - badge_size - margin)
-        elif position == "bottom_left":
-            return (margin, height - badge_size - margin)
-        elif position == "top_right":
-            return (width - badge_size - margin, margin)
-        elif position == "top_left":
-            return (margin, margin)
-        else:
-            # Default to bottom_right
-            return (width - badge_size - margin, height - badge_size - margin)
+            key = (style, is_home, badge_size)
+            overlay = self._sprite_cache.get(key)
+            if overlay is None:
+                # Badge plus its 2px shadow
+                overlay = Image.new("RGBA", (badge_size + 3, badge_size + 3), (0, 0, 0, 0))
+                self._draw_badge(ImageDraw.Draw(overlay), 0, 0, is_home, badge_size)
+                self._sprite_cache[key] = overlay
+            return overlay, (x, y)
+        if style == "text":
+            text = home_text if is_home else away_text
+            overlay, (text_x, text_y) = self._draw_text(is_home, text, font_size)
+            return overlay, (x - text_x, y - text_y)
+        if style == "icon":
+            key = (style, is_home, icon_size)
+            overlay = self._sprite_cache.get(key)
+            if overlay is None:
+                overlay = Image.new("RGBA", (icon_size + 1, icon_size + 1), (0, 0, 0, 0))
+                self._draw_icon(ImageDraw.Draw(overlay), 0, 0, is_home, icon_size)
+                self._sprite_cache[key] = overlay
+            return overlay, (x, y)
+        
+        # Unknown style: nothing to draw
+        return Image.new("RGBA", (1, 1), (0, 0, 0, 0)), (0, 0)
 
     def _draw_badge(
         self, draw: ImageDraw.Draw, x: int, y: int, is_home: bool, badge_size: int = 40
@@ -159,26 +235,34 @@ class ImageProcessor:
         )
 
     def _draw_text(
-        self, draw: ImageDraw.Draw, x: int, y: int, is_home: bool, width: int, height: int, font_size: int = 16, margin: int = 15, home_text: str = "집에 있음", away_text: str = "외출 중"
-    ) -> None:
-        """Draw subtle text overlay."""
-        text = home_text if is_home else away_text
-        try:
-            # Try to use a system font
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
-        except:
-            try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", font_size)
-            except:
-                font = ImageFont.load_default()
+        self, is_home: bool, text: str, font_size: int = 16
+    ) -> tuple[Image.Image, tuple[int, int]]:
+        """Draw subtle text overlay.
+        
+        Returns the sprite and where the text origin sits inside it, since the
+        background extends past the text on every side.
+        """
+        font = self._get_font(font_size)
         
         # Get text bounding box
-        bbox = draw.textbbox((0, 0), text, font=font)
+        bbox = font.getbbox(text)
         text_width = bbox[2] - bbox[0]
         text_height = bbox[3] - bbox[1]
         
-        # Subtle background rectangle with rounded corners
+        # Sprite covering the background, and the glyphs should they overhang it
         padding = 8
+        overlay = Image.new(
+            "RGBA",
+            (
+                max(text_width + padding, bbox[2]) + padding + 1,
+                max(text_height + padding, bbox[3]) + padding + 1,
+            ),
+            (0, 0, 0, 0),
+        )
+        draw = ImageDraw.Draw(overlay)
+        x = y = padding
+        
+        # Subtle background rectangle with rounded corners
         bg_color = (0, 0, 0, 140)  # More transparent
         draw.rounded_rectangle(
             [
@@ -192,6 +276,7 @@ class ImageProcessor:
         # Text color - subtle but visible
         text_color = (144, 238, 144, 240) if is_home else (200, 200, 200, 220)  # Light green for home, light gray for away
         draw.text((x, y), text, fill=text_color, font=font)
+        return overlay, (x, y)
 
     def _draw_icon(
         self, draw: ImageDraw.Draw, x: int, y: int, is_home: bool, icon_size: int = 32
@@ -1,16 +1,21 @@
 """Options flow for BLOOMIN Presence Display integration."""
 from __future__ import annotations
 
+from collections import ChainMap
+from functools import lru_cache
 import logging
+from pathlib import Path
+import stat
 from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.config_entries import OptionsFlow
+from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers import selector
 
 from .const import (
+    BLE_MAC_ADDRESS_RE,
     CONF_BLE_MAC_ADDRESS,
     CONF_IMAGE_PATH,
     CONF_IMAGE_QUALITY,
@@ -34,17 +39,90 @@ from .const import (
     DEFAULT_OVERLAY_STYLE,
     IMAGE_SOURCE_FILE,
     IMAGE_SOURCE_FOLDER,
-    OVERLAY_POSITION_BOTTOM_RIGHT,
-    OVERLAY_POSITION_BOTTOM_LEFT,
-    OVERLAY_POSITION_TOP_RIGHT,
-    OVERLAY_POSITION_TOP_LEFT,
-    OVERLAY_STYLE_BADGE,
-    OVERLAY_STYLE_TEXT,
-    OVERLAY_STYLE_ICON,
+)
+from .flow_selectors import (
+    IMAGE_SOURCE_SELECTOR,
+    OVERLAY_POSITION_SELECTOR,
+    OVERLAY_STYLE_SELECTOR,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Integer options: (key, default, min, max)
+_INT_FIELDS: tuple[tuple[str, int, int, int], ...] = (
+    (CONF_IMAGE_QUALITY, DEFAULT_IMAGE_QUALITY, 1, 100),
+    (CONF_OVERLAY_BADGE_SIZE, DEFAULT_OVERLAY_BADGE_SIZE, 10, 200),
+    (CONF_OVERLAY_ICON_SIZE, DEFAULT_OVERLAY_ICON_SIZE, 10, 200),
+    (CONF_OVERLAY_FONT_SIZE, DEFAULT_OVERLAY_FONT_SIZE, 8, 72),
+    (CONF_OVERLAY_MARGIN, DEFAULT_OVERLAY_MARGIN, 0, 100),
+)
+
+# Defaults of the options that can be overridden per entry in the options flow
+_OPTION_DEFAULTS: dict[str, Any] = {
+    CONF_OVERLAY_POSITION: DEFAULT_OVERLAY_POSITION,
+    CONF_OVERLAY_STYLE: DEFAULT_OVERLAY_STYLE,
+    **{key: default for key, default, _, _ in _INT_FIELDS},
+    CONF_USE_BLE_WAKE: False,
+}
+
+
+@lru_cache(maxsize=16)
+def _int_range(minimum: int, maximum: int) -> vol.All:
+    """Return the shared integer validator for a range."""
+    return vol.All(vol.Coerce(int), vol.Range(min=minimum, max=maximum))
+
+
+@lru_cache(maxsize=8)
+def _options_schema(image_source: str, ble_required: bool) -> vol.Schema:
+    """Return the options schema for an image source and BLE wake setting.
+    
+    Built once per combination, so it carries no defaults: the current values
+    are filled in on each form render with add_suggested_values_to_schema, and
+    omitted fields keep their current value when the form is submitted.
+    """
+    schema_dict = {
+        vol.Optional(CONF_IMAGE_SOURCE): IMAGE_SOURCE_SELECTOR,
+        vol.Optional(CONF_OVERLAY_POSITION): OVERLAY_POSITION_SELECTOR,
+        vol.Optional(CONF_OVERLAY_STYLE): OVERLAY_STYLE_SELECTOR,
+        **{
+            vol.Optional(key): _int_range(minimum, maximum)
+            for key, _, minimum, maximum in _INT_FIELDS
+        },
+        vol.Optional(CONF_USE_BLE_WAKE): bool,
+    }
+    
+    # Conditionally add image source specific fields
+    if image_source == IMAGE_SOURCE_FOLDER:
+        schema_dict[vol.Required(CONF_MEDIA_FOLDER)] = str
+    elif image_source == IMAGE_SOURCE_FILE:
+        schema_dict[vol.Required(CONF_IMAGE_PATH)] = str
+    
+    # Conditionally add BLE MAC address field
+    if ble_required:
+        schema_dict[vol.Required(CONF_BLE_MAC_ADDRESS)] = str
+    else:
+        schema_dict[vol.Optional(CONF_BLE_MAC_ADDRESS)] = str
+    
+    return vol.Schema(schema_dict)
+
+
+def _image_path_error(check_path: Path) -> str | None:
+    """Return the error key for check_path, or None if it is a file (blocking)."""
+    # One stat call answers both exists and is-file
+    try:
+        st = check_path.stat()
+    except OSError:
+        # Missing, a parent is not a directory, or not accessible
+        return "image_path_not_found"
+    if not stat.S_ISREG(st.st_mode):
+        return "image_path_not_file"
+    return None
+
+
+async def _validate_image_path(hass: HomeAssistant, check_path: Path) -> str | None:
+    """Check the configured image file in the executor; return an error key or None."""
+    return await hass.async_add_executor_job(_image_path_error, check_path)
+
 
 class BloominPresenceOptionsFlowHandler(OptionsFlow):
     """Handle options flow for BLOOMIN Presence Display."""
@@ -54,10 +132,21 @@ class BloominPresenceOptionsFlowHandler(OptionsFlow):
     ) -> FlowResult:
         """Manage the options."""
         errors: dict[str, str] = {}
+        current_values = self._current_values()
         
         if user_input is not None:
+            # Fields left out of the submission keep their current value
+            image_source = user_input.get(CONF_IMAGE_SOURCE, current_values[CONF_IMAGE_SOURCE])
+            ble_wake = user_input.get(CONF_USE_BLE_WAKE, current_values[CONF_USE_BLE_WAKE])
+            user_input = {
+                **{
+                    key: current_values[key]
+                    for key in map(str, _options_schema(image_source, bool(ble_wake)).schema)
+                },
+                **user_input,
+            }
+            
             # Validate image source configuration
-            image_source = user_input.get(CONF_IMAGE_SOURCE, DEFAULT_IMAGE_SOURCE)
             if image_source == IMAGE_SOURCE_FOLDER:
                 media_folder = user_input.get(CONF_MEDIA_FOLDER, "")
                 if not media_folder:
@@ -68,17 +157,14 @@ class BloominPresenceOptionsFlowHandler(OptionsFlow):
                     errors["base"] = "image_path_required"
                 else:
                     # Check if file exists
-                    from pathlib import Path
                     if Path(image_path).is_absolute():
                         check_path = Path(image_path)
                     else:
                         media_dir = Path(self.hass.config.media_dirs.get("local", self.hass.config.path("media")))
                         check_path = media_dir / image_path
                     
-                    if not check_path.exists():
-                        errors["base"] = "image_path_not_found"
-                    elif not check_path.is_file():
-                        errors["base"] = "image_path_not_file"
+                    if error := await _validate_image_path(self.hass, check_path):
+                        errors["base"] = error
             
             # Validate BLE MAC address if BLE wake is enabled
             if user_input.get(CONF_USE_BLE_WAKE):
@@ -87,116 +173,45 @@ class BloominPresenceOptionsFlowHandler(OptionsFlow):
                     errors["base"] = "ble_mac_address_required"
                 else:
                     # Validate MAC address format
-                    mac_normalized = mac_address.upper().replace("-", ":").replace("_", ":")
-                    parts = mac_normalized.split(":")
-                    if len(parts) != 6 or not all(len(part) == 2 and all(c in "0123456789ABCDEF" for c in part) for part in parts):
+                    if not BLE_MAC_ADDRESS_RE.fullmatch(mac_address):
                         errors["base"] = "invalid_ble_mac_address"
             
             if not errors:
                 return self.async_create_entry(title="", data=user_input)
 
-        options = self.config_entry.options
         data = self.config_entry.data
         
         # Get current image source
         image_source = data.get(CONF_IMAGE_SOURCE, DEFAULT_IMAGE_SOURCE)
         if user_input:
             image_source = user_input.get(CONF_IMAGE_SOURCE, image_source)
-
-        # Build schema
-        schema_dict = {
-            vol.Optional(
-                CONF_IMAGE_SOURCE,
-                default=data.get(CONF_IMAGE_SOURCE, DEFAULT_IMAGE_SOURCE),
-            ): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=[
-                        IMAGE_SOURCE_FOLDER,
-                        IMAGE_SOURCE_FILE,
-                    ],
-                    translation_key="image_source",
-                )
-            ),
-            vol.Optional(
-                CONF_OVERLAY_POSITION,
-                default=options.get(CONF_OVERLAY_POSITION, DEFAULT_OVERLAY_POSITION),
-            ): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=[
-                        OVERLAY_POSITION_BOTTOM_RIGHT,
-                        OVERLAY_POSITION_BOTTOM_LEFT,
-                        OVERLAY_POSITION_TOP_RIGHT,
-                        OVERLAY_POSITION_TOP_LEFT,
-                    ],
-                    translation_key="overlay_position",
-                )
-            ),
-            vol.Optional(
-                CONF_OVERLAY_STYLE,
-                default=options.get(CONF_OVERLAY_STYLE, DEFAULT_OVERLAY_STYLE),
-            ): selector.SelectSelector(
-                selector.SelectSelectorConfig(
-                    options=[
-                        OVERLAY_STYLE_BADGE,
-                        OVERLAY_STYLE_TEXT,
-                        OVERLAY_STYLE_ICON,
-                    ],
-                    translation_key="overlay_style",
-                )
-            ),
-            vol.Optional(
-                CONF_IMAGE_QUALITY,
-                default=options.get(CONF_IMAGE_QUALITY, data.get(CONF_IMAGE_QUALITY, DEFAULT_IMAGE_QUALITY)),
-            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
-            vol.Optional(
-                CONF_OVERLAY_BADGE_SIZE,
-                default=options.get(CONF_OVERLAY_BADGE_SIZE, data.get(CONF_OVERLAY_BADGE_SIZE, DEFAULT_OVERLAY_BADGE_SIZE)),
-            ): vol.All(vol.Coerce(int), vol.Range(min=10, max=200)),
-            vol.Optional(
-                CONF_OVERLAY_ICON_SIZE,
-                default=options.get(CONF_OVERLAY_ICON_SIZE, data.get(CONF_OVERLAY_ICON_SIZE, DEFAULT_OVERLAY_ICON_SIZE)),
-            ): vol.All(vol.Coerce(int), vol.Range(min=10, max=200)),
-            vol.Optional(
-                CONF_OVERLAY_FONT_SIZE,
-                default=options.get(CONF_OVERLAY_FONT_SIZE, data.get(CONF_OVERLAY_FONT_SIZE, DEFAULT_OVERLAY_FONT_SIZE)),
-            ): vol.All(vol.Coerce(int), vol.Range(min=8, max=72)),
-            vol.Optional(
-                CONF_OVERLAY_MARGIN,
-                default=options.get(CONF_OVERLAY_MARGIN, data.get(CONF_OVERLAY_MARGIN, DEFAULT_OVERLAY_MARGIN)),
-            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=100)),
-            vol.Optional(
-                CONF_USE_BLE_WAKE,
-                default=options.get(CONF_USE_BLE_WAKE, data.get(CONF_USE_BLE_WAKE, False)),
-            ): bool,
-        }
-        
-        # Conditionally add image source specific fields
-        if image_source == IMAGE_SOURCE_FOLDER:
-            schema_dict[vol.Required(
-                CONF_MEDIA_FOLDER,
-                default=data.get(CONF_MEDIA_FOLDER, DEFAULT_MEDIA_FOLDER),
-            )] = str
-        elif image_source == IMAGE_SOURCE_FILE:
-            schema_dict[vol.Required(
-                CONF_IMAGE_PATH,
-                default=data.get(CONF_IMAGE_PATH, ""),
-            )] = str
+        ble_required = bool(
+            user_input and user_input.get(CONF_USE_BLE_WAKE) or data.get(CONF_USE_BLE_WAKE, False)
+        )
         
-        # Conditionally add BLE MAC address field
-        if user_input and user_input.get(CONF_USE_BLE_WAKE) or data.get(CONF_USE_BLE_WAKE, False):
-            schema_dict[vol.Required(
-                CONF_BLE_MAC_ADDRESS,
-                default=data.get(CONF_BLE_MAC_ADDRESS, ""),
-            )] = str
-        else:
-            schema_dict[vol.Optional(
-                CONF_BLE_MAC_ADDRESS,
-                default=data.get(CONF_BLE_MAC_ADDRESS, ""),
-            )] = str
-
-        data_schema = vol.Schema(schema_dict)
+        if user_input:
+            # Validation failed: show what was submitted rather than the stored values
+            current_values.update(user_input)
+        data_schema = self.add_suggested_values_to_schema(
+            _options_schema(image_source, ble_required), current_values
+        )
 
         return self.async_show_form(
             step_id="init", data_schema=data_schema, errors=errors
         )
 
+    def _current_values(self) -> dict[str, Any]:
+        """Return the entry's current value for every field of the options form."""
+        options = self.config_entry.options
+        data = self.config_entry.data
+        # Overlay options fall back from options to data to their defaults;
+        # the image source and BLE MAC settings live in data only
+        merged = ChainMap(options, data, _OPTION_DEFAULTS)
+        return {
+            **{key: merged[key] for key in _OPTION_DEFAULTS},
+            CONF_IMAGE_SOURCE: data.get(CONF_IMAGE_SOURCE, DEFAULT_IMAGE_SOURCE),
+            CONF_MEDIA_FOLDER: data.get(CONF_MEDIA_FOLDER, DEFAULT_MEDIA_FOLDER),
+            CONF_IMAGE_PATH: data.get(CONF_IMAGE_PATH, ""),
+            CONF_BLE_MAC_ADDRESS: data.get(CONF_BLE_MAC_ADDRESS, ""),
+        }
+
@@ -1,16 +1,19 @@
 """Services for BLOOMIN Presence Display."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import config_validation as cv
 
+from .ble_wake import wake_devices_via_ble
 from .const import DOMAIN
+from .coordinator import BloominData, BloominPresenceCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,97 +34,138 @@ SERVICE_SCHEMA_UPLOAD_IMAGE = vol.Schema(
 )
 
 
+def _resolve_coordinator(hass: HomeAssistant, entity_id: str) -> BloominPresenceCoordinator | None:
+    """Return the coordinator for a service target given as entry_id or entry title."""
+    data: BloominData = hass.data[DOMAIN]
+    # First, try to find by entry_id (most reliable)
+    coordinator = data.coordinators.get(entity_id)
+    if coordinator:
+        _LOGGER.debug("Found coordinator by entry_id: %s", entity_id)
+        return coordinator
+    
+    # Then by entry title
+    entry_id = data.entry_ids_by_title.get(entity_id)
+    if entry_id is None:
+        return None
+    _LOGGER.debug("Found coordinator by title: %s (entry_id: %s)", entity_id, entry_id)
+    return data.coordinators.get(entry_id)
+
+
+def _resolve_coordinators(hass: HomeAssistant, entity_id: str | None) -> list[BloominPresenceCoordinator]:
+    """Return the coordinators a service call targets (all of them without entity_id).
+    
+    Logs why and returns an empty list when there is nothing to update.
+    """
+    data: BloominData = hass.data[DOMAIN]
+    if not data.coordinators:
+        _LOGGER.warning("No BLOOMIN Presence Display integrations found")
+        return []
+    
+    if not entity_id:
+        return list(data.coordinators.values())
+    
+    coordinator = _resolve_coordinator(hass, entity_id)
+    if not coordinator:
+        _LOGGER.warning("No coordinator found for entity_id: %s", entity_id)
+        return []
+    return [coordinator]
+
+
+async def _async_wake_ble_devices(hass: HomeAssistant, coordinators: list[Any]) -> list[bool]:
+    """Wake all BLE-enabled displays concurrently.
+    
+    Returns whether each coordinator was woken, in the same order. Only used
+    when a service call targets more than one display; a single display is
+    woken by its own coordinator.
+    """
+    woken = [False] * len(coordinators)
+    ble_indexes = [
+        index
+        for index, coord in enumerate(coordinators)
+        if coord and coord.use_ble_wake and coord.ble_mac_address
+    ]
+    if len(coordinators) < 2 or not ble_indexes:
+        return woken
+    
+    ble_coordinators = [coordinators[index] for index in ble_indexes]
+    results = await wake_devices_via_ble(
+        hass,
+        [
+            (coord.ble_mac_address, coord.ble_service_uuid, coord.ble_characteristic_uuid)
+            for coord in ble_coordinators
+        ],
+        sessions={
+            coord.ble_session.mac_address: coord.ble_session
+            for coord in ble_coordinators
+            if coord.ble_session
+        },
+    )
+    for index, result in zip(ble_indexes, results):
+        woken[index] = result
+    return woken
+
+
+async def _async_dispatch(
+    hass: HomeAssistant,
+    entity_id: str | None,
+    success_message: str,
+    failure_message: str,
+    image_path: Path | None = None,
+) -> None:
+    """Wake and update the displays a service call targets, concurrently."""
+    coordinators = _resolve_coordinators(hass, entity_id)
+    if not coordinators:
+        return
+    
+    # Wake multiple displays concurrently, then update them concurrently
+    woken = await _async_wake_ble_devices(hass, coordinators)
+    results = await asyncio.gather(
+        *(
+            coord.process_and_upload_image(image_path, wake=not was_woken)
+            for coord, was_woken in zip(coordinators, woken)
+        ),
+        return_exceptions=True,
+    )
+    for result in results:
+        if result is True:
+            _LOGGER.info(success_message)
+        elif isinstance(result, Exception):
+            _LOGGER.error("%s: %s", failure_message, result)
+        else:
+            _LOGGER.error(failure_message)
+
+
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for BLOOMIN Presence Display."""
 
     async def update_display_service(call: ServiceCall) -> None:
         """Handle update_display service call - processes latest image from media folder."""
-        # Get all coordinators and process for each
-        coordinators = list(hass.data[DOMAIN].values())
-        
-        if not coordinators:
-            _LOGGER.warning("No BLOOMIN Presence Display integrations found")
-            return
-        
-        # If entity_id is provided, find specific coordinator
-        entity_id = call.data.get("entity_id")
-        if entity_id:
-            coordinator = None
-            # First, try to find by entry_id (most reliable)
-            if entity_id in hass.data[DOMAIN]:
-                coordinator = hass.data[DOMAIN][entity_id]
-                _LOGGER.debug("Found coordinator by entry_id: %s", entity_id)
-            else:
-                # Try to find by entry title
-                for entry_id, coord in hass.data[DOMAIN].items():
-                    config_entry = hass.config_entries.async_get_entry(entry_id)
-                    if config_entry and config_entry.title == entity_id:
-                        coordinator = coord
-                        _LOGGER.debug("Found coordinator by title: %s (entry_id: %s)", entity_id, entry_id)
-                        break
-                
-                if not coordinator:
-                    _LOGGER.warning("No coordinator found for entity_id: %s", entity_id)
-            
-            coordinators = [coordinator] if coordinator else []
-        
-        # Process each coordinator
-        for coord in coordinators:
-            if coord:
-                success = await coord.process_and_upload_image()
-                if success:
-                    _LOGGER.info("Updated display")
-                else:
-                    _LOGGER.error("Failed to update display")
+        await _async_dispatch(
+            hass,
+            call.data.get("entity_id"),
+            success_message="Updated display",
+            failure_message="Failed to update display",
+        )
 
     async def upload_image_service(call: ServiceCall) -> None:
         """Handle upload_image service call with optional image path."""
         image_path_str = call.data.get("image_path")
-        entity_id = call.data.get("entity_id")
-        
-        # Get coordinators
-        coordinators = list(hass.data[DOMAIN].values())
-        
-        if not coordinators:
-            _LOGGER.warning("No BLOOMIN Presence Display integrations found")
-            return
-        
-        # If entity_id is provided, find specific coordinator
-        if entity_id:
-            coordinator = None
-            # First, try to find by entry_id (most reliable)
-            if entity_id in hass.data[DOMAIN]:
-                coordinator = hass.data[DOMAIN][entity_id]
-                _LOGGER.debug("Found coordinator by entry_id: %s", entity_id)
-            else:
-                # Try to find by entry title
-                for entry_id, coord in hass.data[DOMAIN].items():
-                    config_entry = hass.config_entries.async_get_entry(entry_id)
-                    if config_entry and config_entry.title == entity_id:
-                        coordinator = coord
-                        _LOGGER.debug("Found coordinator by title: %s (entry_id: %s)", entity_id, entry_id)
-                        break
-                
-                if not coordinator:
-                    _LOGGER.warning("No coordinator found for entity_id: %s", entity_id)
-            
-            coordinators = [coordinator] if coordinator else []
         
         image_path = None
         if image_path_str:
             image_path = Path(image_path_str)
-            if not image_path.exists():
-                _LOGGER.error("Image path does not exist: %s", image_path)
+            # Stat in the executor; is_file also rejects directories
+            if not await hass.async_add_executor_job(image_path.is_file):
+                _LOGGER.error("Image path does not exist or is not a file: %s", image_path)
                 return
         
-        # Process each coordinator
-        for coord in coordinators:
-            if coord:
-                success = await coord.process_and_upload_image(image_path)
-                if success:
-                    _LOGGER.info("Uploaded image")
-                else:
-                    _LOGGER.error("Failed to upload image")
+        await _async_dispatch(
+            hass,
+            call.data.get("entity_id"),
+            success_message="Uploaded image",
+            failure_message="Failed to upload image",
+            image_path=image_path,
+        )
 
     hass.services.async_register(
         DOMAIN,